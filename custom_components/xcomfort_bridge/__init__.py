@@ -1,6 +1,7 @@
 """Support for XComfort Bridge."""
 
 import asyncio
+import contextlib
 import logging
 
 from homeassistant.config_entries import ConfigEntry
@@ -26,6 +27,10 @@ PLATFORMS = [
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound on waiting for SET_BRIDGE_DATA; matches the fixed one-second
+# sleep this replaced, so setup is never slower than before
+BRIDGE_DATA_TIMEOUT = 1
+
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Boilerplate."""
@@ -51,9 +56,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Wait for bridge to initialize and get firmware info
     await hub.bridge.wait_for_initialization()
 
-    # Wait a bit for bridge info (firmware, name, type) to arrive in SET_BRIDGE_DATA message
-    # This message arrives after wait_for_initialization completes
-    await asyncio.sleep(1)
+    # Bridge info (name, type) arrives in a SET_BRIDGE_DATA message which may
+    # trail initialization; wait for it, but don't block setup if it never shows.
+    # Without it the bridge device falls back to the entry title.
+    with contextlib.suppress(TimeoutError):
+        async with asyncio.timeout(BRIDGE_DATA_TIMEOUT):
+            await hub.bridge.home_data_received.wait()
 
     # Log hub information for debugging
     _LOGGER.info(
@@ -63,16 +71,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hub.bridge_model,
         hub.firmware_version,
     )
-    _LOGGER.info(
-        "Bridge raw attributes - fw_version: %s, bridge_name: %s, bridge_type: %s",
-        getattr(hub.bridge, "fw_version", "NOT SET"),
-        getattr(hub.bridge, "bridge_name", "NOT SET"),
-        getattr(hub.bridge, "bridge_type", "NOT SET"),
-    )
 
-    # Register the device with all hub information
+    # Register the device with all hub information; async_get_or_create also
+    # updates these fields when the device already exists.
     device_registry = dr.async_get(hass)
-    device = device_registry.async_get_or_create(
+    device_registry.async_get_or_create(
         config_entry_id=entry.entry_id,
         identifiers={(DOMAIN, hub.hub_id)},
         manufacturer="Eaton",
@@ -82,15 +85,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         serial_number=hub.bridge.bridge_id,
     )
 
-    # Update device info in case it already existed
-    device_registry.async_update_device(
-        device.id,
-        name=hub.bridge_name or entry.title,
-        model=hub.bridge_model,
-        sw_version=hub.firmware_version,
-        serial_number=hub.bridge.bridge_id,
-    )
-
     entry.async_create_task(hass, hub.load_devices())
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -103,14 +97,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hub = XComfortHub.get_hub(hass, entry)
     await hub.stop()
 
-    unload_ok = all(
-        await asyncio.gather(
-            *[
-                hass.config_entries.async_forward_entry_unload(entry, platform)
-                for platform in PLATFORMS
-            ]
-        )
-    )
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
 
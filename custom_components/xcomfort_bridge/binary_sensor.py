@@ -7,21 +7,25 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .entity_lifecycle import (
+    async_write_state_safely,
     init_entity_lifecycle,
     mark_entity_added,
-    schedule_state_update_safely,
     subscribe_observable,
 )
 from .hub import XComfortHub
-from .xcomfort.devices import DoorSensor, DoorWindowSensor, WindowSensor
+from .xcomfort.devices import DoorSensor, WindowSensor
 
 _LOGGER = logging.getLogger(__name__)
 
-x = 123
+# Concrete sensor type -> Home Assistant device class
+DEVICE_CLASS_BY_TYPE: dict[type, BinarySensorDeviceClass] = {
+    WindowSensor: BinarySensorDeviceClass.WINDOW,
+    DoorSensor: BinarySensorDeviceClass.DOOR,
+}
 
 
 async def async_setup_entry(
@@ -37,28 +41,24 @@ async def async_setup_entry(
     """
     hub = XComfortHub.get_hub(hass, entry)
 
-    async def _wait_for_hub_then_setup():
-        """Wait for hub to complete initial load then set up binary sensors."""
-        await hub.has_done_initial_load.wait()
-
-        devices = hub.devices
-        sensors = []
-
-        # Create a generator expression and extend the list with it
-        sensors.extend(
+    @callback
+    def _setup_entities() -> None:
+        """Set up binary sensors once the hub has loaded its devices."""
+        sensors = [
             XComfortDoorWindowSensor(hub, device)
-            for device in devices
-            if isinstance(device, DoorWindowSensor)
-        )
+            for device in hub.devices_of_type(*DEVICE_CLASS_BY_TYPE)
+        ]
 
         async_add_entities(sensors)
 
-    entry.async_create_task(hass, _wait_for_hub_then_setup())
+    hub.async_on_initial_load(_setup_entities)
 
 
 class XComfortDoorWindowSensor(BinarySensorEntity):
     """Representation of an xComfort door/window binary sensor."""
 
+    _attr_should_poll = False
+
     def __init__(self, hub: XComfortHub, device: WindowSensor | DoorSensor) -> None:
         """Initialize the binary sensor.
 
@@ -72,12 +72,8 @@ class XComfortDoorWindowSensor(BinarySensorEntity):
 
         self.hub = hub
         self._device = device
-        self._attr_state = device.is_open
 
-        if isinstance(device, WindowSensor):
-            self._attr_device_class = BinarySensorDeviceClass.WINDOW
-        elif isinstance(device, DoorSensor):
-            self._attr_device_class = BinarySensorDeviceClass.DOOR
+        self._attr_device_class = DEVICE_CLASS_BY_TYPE.get(type(device))
         init_entity_lifecycle(self)
 
     async def async_added_to_hass(self):
@@ -92,15 +88,17 @@ class XComfortDoorWindowSensor(BinarySensorEntity):
             self, self._device.state, self._state_change, "device.state"
         )
 
+    @callback
     def _state_change(self, state: bool):
         """Handle state changes from the device.
 
+        is_on reads the device directly, so only a state write is needed.
+
         Args:
             state: New state value (True for open, False for closed)
 
         """
-        self._attr_state = state
-        schedule_state_update_safely(self, "device.state")
+        async_write_state_safely(self, "device.state")
 
     @property
     def is_on(self) -> bool | None:
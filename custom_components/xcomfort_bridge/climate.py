@@ -12,14 +12,16 @@ from homeassistant.components.climate.const import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
+from .device_info import get_room_device_info
 from .entity_lifecycle import (
+    async_write_state_safely,
     init_entity_lifecycle,
     mark_entity_added,
-    schedule_state_update_safely,
     subscribe_observable,
 )
 from .hub import XComfortHub
@@ -36,6 +38,43 @@ SUPPORT_FLAGS = (
 
 
 _LOGGER = logging.getLogger(__name__)
+# Room and sensor device pushes often arrive together or in bursts
+# (e.g. after a SET_HEATING_STATE round-trip)
+STATE_WRITE_COOLDOWN_S = 0.2
+
+# ClimateState -> HA HVAC mode (Various has no HA equivalent)
+_STATE_TO_HVAC = {
+    ClimateState.Off: HVACMode.OFF,
+    ClimateState.HeatingAuto: HVACMode.HEAT,
+    ClimateState.HeatingManual: HVACMode.HEAT,
+    ClimateState.CoolingAuto: HVACMode.COOL,
+    ClimateState.CoolingManual: HVACMode.COOL,
+}
+
+# HA HVAC mode -> default ClimateState when switching into it
+_HVAC_TO_STATE = {
+    HVACMode.OFF: ClimateState.Off,
+    HVACMode.HEAT: ClimateState.HeatingAuto,
+    HVACMode.COOL: ClimateState.CoolingAuto,
+}
+
+# HA preset name <-> xComfort ClimateMode
+_PRESET_TO_MODE = {
+    "Frost Protection": ClimateMode.FrostProtection,
+    PRESET_ECO: ClimateMode.Eco,
+    PRESET_COMFORT: ClimateMode.Comfort,
+}
+_MODE_TO_PRESET = {mode: preset for preset, mode in _PRESET_TO_MODE.items()}
+
+# Default setpoint values for each mode
+_DEFAULT_SETPOINTS = {
+    ClimateMode.FrostProtection: 8.0,
+    ClimateMode.Eco: 18.0,
+    ClimateMode.Comfort: 21.0,
+}
+
+_HEATING_STATES = frozenset((ClimateState.HeatingAuto, ClimateState.HeatingManual))
+_COOLING_STATES = frozenset((ClimateState.CoolingAuto, ClimateState.CoolingManual))
 
 
 async def async_setup_entry(
@@ -51,67 +90,66 @@ async def async_setup_entry(
     """
     hub = XComfortHub.get_hub(hass, entry)
 
-    async def _wait_for_hub_then_setup():
-        await hub.has_done_initial_load.wait()
-
-        devices = hub.devices
+    @callback
+    def _setup_entities() -> None:
         rooms = hub.rooms
+        devices_by_id = hub.devices_by_id
 
-        _LOGGER.debug("Found %d xcomfort rooms", len(list(rooms)))
-
-        # Create a mapping of device_id to device for linking room sensors
-        devices_by_id = {device.device_id: device for device in devices}
+        _LOGGER.debug("Found %d xcomfort rooms", len(rooms))
 
         climate_entities = []
         for room in rooms:
             # Check if room has climate control (temperatureOnly must exist and be False)
-            if room.state.value is not None and hasattr(room.state.value, "raw"):
-                raw = room.state.value.raw
-
-                # Only create climate entity if temperatureOnly exists and is False
-                if "temperatureOnly" in raw and raw.get("temperatureOnly") is False:
-                    # Get the sensor device if roomSensorId is specified
-                    sensor_device = None
-                    room_sensor_id = raw.get("roomSensorId")
-                    if room_sensor_id is not None:
-                        sensor_device = devices_by_id.get(room_sensor_id)
-                        if sensor_device:
-                            _LOGGER.debug(
-                                "Room '%s' linked to sensor device '%s' (ID: %d)",
-                                room.name,
-                                sensor_device.name
-                                if hasattr(sensor_device, "name")
-                                else "Unknown",
-                                room_sensor_id,
-                            )
-
-                    _LOGGER.debug(
-                        "Creating climate entity for room '%s' (temperatureOnly=False)",
-                        room.name,
-                    )
-                    climate_entity = HASSXComfortRoomClimate(
-                        hass, hub, room, sensor_device
-                    )
-                    climate_entities.append(climate_entity)
-                else:
-                    _LOGGER.debug(
-                        "Skipping climate entity for room '%s' (temperatureOnly=%s)",
-                        room.name,
-                        raw.get("temperatureOnly", "not set"),
-                    )
+            raw = getattr(room.state.value, "raw", None)
+            if raw is None:
+                continue
+
+            # Only create climate entity if temperatureOnly exists and is False
+            if raw.get("temperatureOnly") is False:
+                # Get the sensor device if roomSensorId is specified
+                sensor_device = None
+                room_sensor_id = raw.get("roomSensorId")
+                if room_sensor_id is not None:
+                    sensor_device = devices_by_id.get(room_sensor_id)
+                    if sensor_device:
+                        _LOGGER.debug(
+                            "Room '%s' linked to sensor device '%s' (ID: %d)",
+                            room.name,
+                            sensor_device.name,
+                            room_sensor_id,
+                        )
+
+                _LOGGER.debug(
+                    "Creating climate entity for room '%s' (temperatureOnly=False)",
+                    room.name,
+                )
+                climate_entity = HASSXComfortRoomClimate(hass, hub, room, sensor_device)
+                climate_entities.append(climate_entity)
+            else:
+                _LOGGER.debug(
+                    "Skipping climate entity for room '%s' (temperatureOnly=%s)",
+                    room.name,
+                    raw.get("temperatureOnly", "not set"),
+                )
 
         _LOGGER.debug("Added %d room climate entities", len(climate_entities))
         async_add_entities(climate_entities)
 
-    entry.async_create_task(hass, _wait_for_hub_then_setup())
+    hub.async_on_initial_load(_setup_entities)
 
 
 class HASSXComfortRoomClimate(ClimateEntity):
     """Representation of an xComfort Room climate control."""
 
+    _attr_should_poll = False
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
-    # _attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT, HVACMode.COOL]
+    # TODO: detect cooling capability from room config and add HVACMode.COOL
+    _attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT]
+    _attr_preset_modes = list(_PRESET_TO_MODE)
     _attr_supported_features = SUPPORT_FLAGS
+    # Until the first room state arrives; refreshed per preset afterwards
+    _attr_min_temp = 5.0
+    _attr_max_temp = 40.0
 
     def __init__(
         self,
@@ -133,25 +171,37 @@ class HASSXComfortRoomClimate(ClimateEntity):
         self.hub = hub
         self._room = room
         self._sensor_device = sensor_device
-        self._name = room.name
         self._state = None
 
         self.rctpreset = ClimateMode.Comfort
         self.rctstate = ClimateState.Off
-        self.temperature = 20.0
-        self.humidity = 50.0
-        self.currentsetpoint = 20.0
         self._last_active_state = ClimateState.HeatingAuto
-
-        self._unique_id = f"climate_{DOMAIN}_{hub.identifier}-room_{room.room_id}"
+        self._attr_current_temperature = 20.0
+        self._attr_current_humidity = 50
+        self._attr_target_temperature = 20.0
+        self._update_mode_attrs()
+        self._update_setpoint_range()
+
+        self._attr_name = room.name
+        self._attr_unique_id = f"climate_{DOMAIN}_{hub.identifier}-room_{room.room_id}"
+        # Link to the room device created by sensors
+        self._attr_device_info = get_room_device_info(hub, room)
+        self._debounced_write = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=STATE_WRITE_COOLDOWN_S,
+            immediate=True,
+            function=self._flush_state,
+        )
         init_entity_lifecycle(self)
 
     async def async_added_to_hass(self):
         """Run when entity about to be added to hass."""
         await super().async_added_to_hass()
         mark_entity_added(self)
+        self.async_on_remove(self._debounced_write.async_cancel)
 
-        _LOGGER.debug("Added to hass room climate %s", self._name)
+        _LOGGER.debug("Added to hass room climate %s", self._attr_name)
 
         # Subscribe to room state for all climate data
         subscribe_observable(
@@ -160,7 +210,7 @@ class HASSXComfortRoomClimate(ClimateEntity):
 
         # Optionally subscribe to sensor device for temperature and humidity if linked
         if self._sensor_device is not None:
-            _LOGGER.debug("Subscribing to sensor device for room %s", self._name)
+            _LOGGER.debug("Subscribing to sensor device for room %s", self._attr_name)
             subscribe_observable(
                 self,
                 self._sensor_device.state,
@@ -168,6 +218,7 @@ class HASSXComfortRoomClimate(ClimateEntity):
                 "sensor_device.state",
             )
 
+    @callback
     def _room_state_change(self, state):
         """Handle room state changes for climate control.
 
@@ -175,35 +226,46 @@ class HASSXComfortRoomClimate(ClimateEntity):
             state: New state from the room
 
         """
+        first_state = self._state is None
         self._state = state
 
         if self._state is not None:
-            if "currentMode" in state.raw:
-                self.rctpreset = ClimateMode(state.raw["currentMode"])
-            if "mode" in state.raw:
-                self.rctpreset = ClimateMode(state.raw["mode"])
-            if "state" in state.raw:
-                self.rctstate = ClimateState(state.raw["state"])
+            previous_preset = self.rctpreset
+            raw = state.raw
+            # "mode" takes precedence over "currentMode" when both are present
+            mode = raw.get("mode")
+            if mode is None:
+                mode = raw.get("currentMode")
+            if mode is not None:
+                self.rctpreset = ClimateMode(mode)
+            rct_state = raw.get("state")
+            if rct_state is not None:
+                self.rctstate = ClimateState(rct_state)
                 # Track last non-off state so we can restore it
-                if self.rctstate != ClimateState.Off:
+                if self.rctstate is not ClimateState.Off:
                     self._last_active_state = self.rctstate
-            self.currentsetpoint = state.setpoint
+            self._attr_target_temperature = state.setpoint
+            self._update_mode_attrs()
+            if first_state or self.rctpreset is not previous_preset:
+                self._update_setpoint_range()
 
             # Get temperature and humidity from room state (may be overridden by sensor device)
             if state.temperature is not None:
-                self.temperature = state.temperature
+                self._attr_current_temperature = state.temperature
             if state.humidity is not None:
-                self.humidity = state.humidity
-
-            _LOGGER.debug(
-                "Room state changed %s : %s (ClimateState: %s)",
-                self._name,
-                state,
-                self.rctstate.name,
-            )
+                self._attr_current_humidity = int(state.humidity)
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Room state changed %s : %s (ClimateState: %s)",
+                    self._attr_name,
+                    state,
+                    self.rctstate.name,
+                )
 
-            schedule_state_update_safely(self, "room.state")
+            self._debounced_write.async_schedule_call()
 
+    @callback
     def _sensor_device_state_change(self, state):
         """Handle sensor device state changes for temperature and humidity.
 
@@ -214,18 +276,48 @@ class HASSXComfortRoomClimate(ClimateEntity):
         if state is not None:
             # Sensor device readings override room readings
             if state.temperature is not None:
-                self.temperature = state.temperature
+                self._attr_current_temperature = state.temperature
             if state.humidity is not None:
-                self.humidity = state.humidity
+                self._attr_current_humidity = int(state.humidity)
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Sensor device state changed for room %s : temp=%s, humidity=%s",
+                    self._attr_name,
+                    state.temperature,
+                    state.humidity,
+                )
 
-            _LOGGER.debug(
-                "Sensor device state changed for room %s : temp=%s, humidity=%s",
-                self._name,
-                state.temperature,
-                state.humidity,
-            )
+            self._debounced_write.async_schedule_call()
 
-            schedule_state_update_safely(self, "sensor_device.state")
+    @callback
+    def _flush_state(self) -> None:
+        """Write coalesced room and sensor device updates to HA."""
+        async_write_state_safely(self, "room.state/sensor_device.state")
+
+    def _update_mode_attrs(self) -> None:
+        """Derive the HA hvac and preset modes from the xComfort state."""
+        hvac_mode = _STATE_TO_HVAC.get(self.rctstate)
+        if hvac_mode is None:
+            _LOGGER.warning(
+                "Unknown ClimateState: %s, defaulting to OFF", self.rctstate
+            )
+            hvac_mode = HVACMode.OFF
+        self._attr_hvac_mode = hvac_mode
+
+        preset = _MODE_TO_PRESET.get(self.rctpreset)
+        if preset is None and self.rctpreset is not ClimateMode.Unknown:
+            _LOGGER.warning("Unexpected preset mode: %s", self.rctpreset)
+        self._attr_preset_mode = preset
+
+    def _update_setpoint_range(self) -> None:
+        """Cache the allowed setpoint range for the current preset."""
+        setpointrange = self._room.bridge.rctsetpointallowedvalues[self.rctpreset]
+        self._setpoint_range = setpointrange
+        # Keep the wide defaults until the room has reported its state
+        if self._state is not None:
+            self._attr_min_temp = setpointrange.Min
+            self._attr_max_temp = setpointrange.Max
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode):
         """Set new HVAC mode.
@@ -239,24 +331,15 @@ class HASSXComfortRoomClimate(ClimateEntity):
         """
         _LOGGER.debug("Set HVAC mode %s", hvac_mode)
 
-        if hvac_mode == HVACMode.OFF:
-            new_state = ClimateState.Off
-        elif hvac_mode == HVACMode.HEAT:
-            # Preserve auto/manual from last active state
-            if self._last_active_state == ClimateState.HeatingManual:
-                new_state = ClimateState.HeatingManual
-            else:
-                new_state = ClimateState.HeatingAuto
-        elif hvac_mode == HVACMode.COOL:
-            if self._last_active_state == ClimateState.CoolingManual:
-                new_state = ClimateState.CoolingManual
-            else:
-                new_state = ClimateState.CoolingAuto
-        else:
+        new_state = _HVAC_TO_STATE.get(hvac_mode)
+        if new_state is None:
             _LOGGER.warning("Unsupported HVAC mode: %s", hvac_mode)
             return
+        # Preserve auto/manual from last active state
+        if _STATE_TO_HVAC.get(self._last_active_state) == hvac_mode:
+            new_state = self._last_active_state
 
-        if self.rctstate != new_state:
+        if self.rctstate is not new_state:
             payload = {
                 "roomId": self._room.room_id,
                 "state": new_state.value,
@@ -264,9 +347,10 @@ class HASSXComfortRoomClimate(ClimateEntity):
             }
             await self._room.bridge.send_message(Messages.SET_HEATING_STATE, payload)
             self.rctstate = new_state
-            if new_state != ClimateState.Off:
+            if new_state is not ClimateState.Off:
                 self._last_active_state = new_state
-            self.schedule_update_ha_state()
+            self._update_mode_attrs()
+            self.async_write_ha_state()
 
     async def async_set_preset_mode(self, preset_mode):
         """Set new preset mode.
@@ -277,87 +361,61 @@ class HASSXComfortRoomClimate(ClimateEntity):
         """
         _LOGGER.debug("Set Preset mode %s", preset_mode)
 
-        if preset_mode == "Frost Protection":
-            mode = ClimateMode.FrostProtection
-        elif preset_mode == PRESET_ECO:
-            mode = ClimateMode.Eco
-        elif preset_mode == PRESET_COMFORT:
-            mode = ClimateMode.Comfort
-        else:
+        mode = _PRESET_TO_MODE.get(preset_mode)
+        if mode is None:
             _LOGGER.warning("Unsupported preset mode: %s", preset_mode)
             return
 
-        if self.rctpreset != mode:
-            # Default setpoint values for each mode
-            default_setpoints = {
-                ClimateMode.FrostProtection: 8.0,
-                ClimateMode.Eco: 18.0,
-                ClimateMode.Comfort: 21.0,
-            }
+        if self.rctpreset is not mode:
+            room_id = self._room.room_id
+            send_message = self._room.bridge.send_message
 
             # Get the default setpoint for the new mode
-            new_setpoint = default_setpoints[mode]
+            new_setpoint = _DEFAULT_SETPOINTS[mode]
 
-            if self.rctstate == ClimateState.Off:
+            if self.rctstate is ClimateState.Off:
                 # Turn the room on first before changing preset
                 wake_state = self._last_active_state
                 wake_payload = {
-                    "roomId": self._room.room_id,
+                    "roomId": room_id,
                     "state": wake_state.value,
                     "confirmed": True,
                 }
-                await self._room.bridge.send_message(
-                    Messages.SET_HEATING_STATE, wake_payload
-                )
+                await send_message(Messages.SET_HEATING_STATE, wake_payload)
                 self.rctstate = wake_state
 
-            if mode == ClimateMode.FrostProtection:
+            # Presets always run in manual; frost protection is heating-only
+            if mode is ClimateMode.FrostProtection or self.rctstate in _HEATING_STATES:
                 new_state = ClimateState.HeatingManual
+            else:
+                new_state = ClimateState.CoolingManual
 
-            if mode == ClimateMode.Eco:
-                if self.rctstate in [
-                    ClimateState.HeatingAuto,
-                    ClimateState.HeatingManual,
-                ]:
-                    new_state = ClimateState.HeatingManual
-                else:
-                    new_state = ClimateState.CoolingManual
-
-            if mode == ClimateMode.Comfort:
-                if self.rctstate in [
-                    ClimateState.HeatingAuto,
-                    ClimateState.HeatingManual,
-                ]:
-                    new_state = ClimateState.HeatingManual
-                else:
-                    new_state = ClimateState.CoolingManual
-
-            # Step 1: Flip to manual state (auto/manual toggle — no setpoint per app protocol)
-            payload_state = {
-                "roomId": self._room.room_id,
-                "mode": self.rctpreset.value,
-                "state": new_state.value,
-                "confirmed": False,
-            }
-            await self._room.bridge.send_message(
-                Messages.SET_HEATING_STATE, payload_state
-            )
-            self.rctstate = new_state
+            # Step 1: Flip to manual state (auto/manual toggle — no setpoint per app protocol).
+            # Skipped when the room is already in that state, saving a round-trip.
+            if self.rctstate is not new_state:
+                payload_state = {
+                    "roomId": room_id,
+                    "mode": self.rctpreset.value,
+                    "state": new_state.value,
+                    "confirmed": False,
+                }
+                await send_message(Messages.SET_HEATING_STATE, payload_state)
+                self.rctstate = new_state
 
             # Step 2: Change the mode/preset (no setpoint per app protocol)
             payload_mode = {
-                "roomId": self._room.room_id,
+                "roomId": room_id,
                 "mode": mode.value,
                 "state": new_state.value,
                 "confirmed": False,
             }
-            await self._room.bridge.send_message(
-                Messages.SET_HEATING_STATE, payload_mode
-            )
+            await send_message(Messages.SET_HEATING_STATE, payload_mode)
             self.rctpreset = mode
             self.rctstate = new_state
-            self.currentsetpoint = new_setpoint
-            self.schedule_update_ha_state()
+            self._attr_target_temperature = new_setpoint
+            self._update_mode_attrs()
+            self._update_setpoint_range()
+            self.async_write_ha_state()
 
     async def async_set_temperature(self, **kwargs):
         """Set new target temperature.
@@ -373,143 +431,48 @@ class HASSXComfortRoomClimate(ClimateEntity):
         # To facilitate easier debugging inside HA.
         # Also consider changing the `mode` object on RoomState class to be just a number,
         # at current it is an object(possibly due to erroneous parsing of the 300/310-messages)
-        setpoint = kwargs["temperature"]
-        setpointrange = self._room.bridge.rctsetpointallowedvalues[
-            ClimateMode(self.rctpreset)
-        ]
-
-        setpoint = min(setpointrange.Max, setpoint)
-
-        setpoint = max(setpoint, setpointrange.Min)
+        room = self._room
+        preset = self.rctpreset
+        setpointrange = self._setpoint_range
+        setpoint = max(
+            setpointrange.Min, min(setpointrange.Max, kwargs["temperature"])
+        )
 
         payload = {
-            "roomId": self._room.room_id,
-            "mode": self.rctpreset.value,
+            "roomId": room.room_id,
+            "mode": preset.value,
             "state": self.rctstate.value,
             "setpoint": setpoint,
             "confirmed": False,
         }
-        await self._room.bridge.send_message(Messages.SET_HEATING_STATE, payload)
-        self._room.modesetpoints[self.rctpreset] = setpoint
-        self.currentsetpoint = setpoint
+        await room.bridge.send_message(Messages.SET_HEATING_STATE, payload)
+        room.modesetpoints[preset] = setpoint
+        self._attr_target_temperature = setpoint
+        self.async_write_ha_state()
         # After moving everything to base library, ideally line below should be the entry point
         # into the library for setting target temperature.
         # await self._room.set_target_temperature(kwargs["temperature"])
 
-    @property
-    def device_info(self):
-        """Return device information about this entity."""
-        # Link to the room device created by sensors
-        device_id = f"room_{DOMAIN}_{self.hub.identifier}_{self._room.room_id}"
-        return {
-            "identifiers": {(DOMAIN, device_id)},
-            "name": self._name,
-            "manufacturer": "Eaton",
-            "model": "xComfort Room",
-            "via_device": (DOMAIN, self.hub.hub_id),
-        }
-
-    @property
-    def name(self):
-        """Return the display name of this climate entity."""
-        return self._name
-
-    @property
-    def unique_id(self):
-        """Return a unique ID."""
-        return self._unique_id
-
-    @property
-    def should_poll(self) -> bool:
-        """Return True if entity has to be polled for state.
-
-        The xComfort integration pushes state updates, so polling is not needed.
-        """
-        return False
-
-    @property
-    def current_temperature(self):
-        """Return the current temperature."""
-        return self.temperature
-
-    @property
-    def hvac_modes(self):
-        """Return available HVAC modes."""
-        # TODO: detect cooling capability from room config and add HVACMode.COOL
-        return [HVACMode.OFF, HVACMode.HEAT]
-
-    @property
-    def hvac_mode(self):
-        """Return current HVAC mode based on ClimateState."""
-        if self.rctstate == ClimateState.Off:
-            return HVACMode.OFF
-        if self.rctstate in (ClimateState.HeatingAuto, ClimateState.HeatingManual):
-            return HVACMode.HEAT
-        if self.rctstate in (ClimateState.CoolingAuto, ClimateState.CoolingManual):
-            return HVACMode.COOL
-        _LOGGER.warning("Unknown ClimateState: %s, defaulting to OFF", self.rctstate)
-        return HVACMode.OFF
-
-    @property
-    def current_humidity(self):
-        """Return the current humidity."""
-        return int(self.humidity)
-
     @property
     def hvac_action(self):
         """Return the current running HVAC action."""
-        if self._state is None:
+        state = self._state
+        if state is None:
             return HVACAction.IDLE
 
         # Use valve state to determine if actively heating/cooling
-        valve = self._state.raw.get("valve", 0) if self._state.raw else 0
+        raw = state.raw
+        valve = raw.get("valve", 0) if raw else 0
 
         # Fall back to power if valve is not available or is 0
-        is_active = valve > 0 or self._state.power > 0
+        is_active = valve > 0 or state.power > 0
 
         if is_active:
             # Check if we're in heating or cooling mode
-            if self.rctstate in (ClimateState.HeatingAuto, ClimateState.HeatingManual):
+            rctstate = self.rctstate
+            if rctstate in _HEATING_STATES:
                 return HVACAction.HEATING
-            if self.rctstate in (ClimateState.CoolingAuto, ClimateState.CoolingManual):
+            if rctstate in _COOLING_STATES:
                 return HVACAction.COOLING
 
         return HVACAction.IDLE
-
-    @property
-    def max_temp(self):
-        """Return the maximum temperature."""
-        if self._state is None or self.rctpreset == ClimateMode.Unknown:
-            return 40.0
-        return self._room.bridge.rctsetpointallowedvalues[self.rctpreset].Max
-
-    @property
-    def min_temp(self):
-        """Return the minimum temperature."""
-        if self._state is None or self.rctpreset == ClimateMode.Unknown:
-            return 5.0
-        return self._room.bridge.rctsetpointallowedvalues[self.rctpreset].Min
-
-    @property
-    def target_temperature(self):
-        """Returns the setpoint from RC touch, e.g. target_temperature."""
-        return self.currentsetpoint
-
-    @property
-    def preset_modes(self):
-        """Return available preset modes."""
-        return ["Frost Protection", PRESET_ECO, PRESET_COMFORT]
-
-    @property
-    def preset_mode(self):
-        """Return the current preset mode."""
-        if self.rctpreset == ClimateMode.Unknown:
-            return None
-        if self.rctpreset == ClimateMode.FrostProtection:
-            return "Frost Protection"
-        if self.rctpreset == ClimateMode.Eco:
-            return PRESET_ECO
-        if self.rctpreset == ClimateMode.Comfort:
-            return PRESET_COMFORT
-        _LOGGER.warning("Unexpected preset mode: %s", self.rctpreset)
-        return None
@@ -39,6 +39,16 @@ IDENTIFIER_AND_AUTH = vol.Schema(
 # If added manually, we'll also need the IP address:
 FULL_CONFIG = IDENTIFIER_AND_AUTH.extend({vol.Required(CONF_IP_ADDRESS): str})
 
+# Power/energy section options in form order, with their defaults
+_POWER_SECTION_DEFAULTS: dict[str, bool] = {
+    CONF_ADD_ROOM_POWER_SENSORS: True,
+    CONF_ADD_HEATER_POWER_SENSORS: False,
+    CONF_ADD_LIGHT_POWER_SENSORS: False,
+    CONF_ADD_APPLIANCE_POWER_SENSORS: False,
+}
+_POWER_SECTION_ALLOWED_KEYS = frozenset(_POWER_SECTION_DEFAULTS)
+_POWER_SECTION_OPTIONS = {"collapsed": False}
+
 
 async def _validate_credentials(hass, ip: str, auth_key: str) -> str | None:
     """Probe the bridge with the given credentials.
@@ -85,36 +95,44 @@ class XComfortBridgeConfigFlow(config_entries.ConfigFlow):
         await self.async_set_unique_id(mac)
 
         for entry in self._async_current_entries():
-            if (configured_mac := entry.data.get(CONF_MAC)) is not None and format_mac(
-                configured_mac
-            ) == mac:
-                if (old_ip := entry.data.get(CONF_IP_ADDRESS)) != ip:
+            data = entry.data
+            old_ip = data.get(CONF_IP_ADDRESS)
+            if (configured_mac := data.get(CONF_MAC)) is None:
+                if old_ip == ip:
                     _LOGGER.info(
-                        "Bridge has changed IP-address. Configuring new IP and restarting. [mac=%s, new_ip=%s, old_ip=%s]",
-                        mac,
-                        ip,
-                        old_ip,
+                        "Saved MAC-address for bridge [mac=%s, ip=%s]", mac, ip
                     )
                     self.hass.config_entries.async_update_entry(
-                        entry, data=entry.data | {CONF_IP_ADDRESS: ip}, title=self.title
+                        entry, data=data | {CONF_MAC: mac}
                     )
                     self.hass.async_create_task(
                         self.hass.config_entries.async_reload(entry.entry_id)
                     )
-                return self.async_abort(reason="already_configured")
-            if (
-                entry.data.get(CONF_MAC) is None
-                and entry.data.get(CONF_IP_ADDRESS) == ip
-            ):
-                _LOGGER.info("Saved MAC-address for bridge [mac=%s, ip=%s]", mac, ip)
-                self.hass.config_entries.async_update_entry(
-                    entry, data=entry.data | {CONF_MAC: mac}
-                )
-                self.hass.async_create_task(
-                    self.hass.config_entries.async_reload(entry.entry_id)
-                )
+                    return self.async_abort(reason="already_configured")
+                continue
+
+            if format_mac(configured_mac) != mac:
+                continue
+
+            # Lease renewals for a known bridge are the common case: abort
+            # before touching the entry when nothing changed
+            if old_ip == ip:
                 return self.async_abort(reason="already_configured")
 
+            _LOGGER.info(
+                "Bridge has changed IP-address. Configuring new IP and restarting. [mac=%s, new_ip=%s, old_ip=%s]",
+                mac,
+                ip,
+                old_ip,
+            )
+            self.hass.config_entries.async_update_entry(
+                entry, data=data | {CONF_IP_ADDRESS: ip}, title=self.title
+            )
+            self.hass.async_create_task(
+                self.hass.config_entries.async_reload(entry.entry_id)
+            )
+            return self.async_abort(reason="already_configured")
+
         # TODO: Does it actually look like an xcomfort bridge?
 
         self.data[CONF_MAC] = mac
@@ -219,44 +237,7 @@ class XComfortBridgeOptionsFlowHandler(config_entries.OptionsFlowWithReload):
         section_options = _filter_power_section_options(
             options.get(CONF_POWER_ENERGY_SECTION, {})
         )
-        data_schema = vol.Schema(
-            {
-                vol.Optional(
-                    CONF_POWER_ENERGY_SECTION,
-                    default=section_options,
-                ): section(
-                    vol.Schema(
-                        {
-                            vol.Optional(
-                                CONF_ADD_ROOM_POWER_SENSORS,
-                                default=section_options.get(
-                                    CONF_ADD_ROOM_POWER_SENSORS, True
-                                ),
-                            ): bool,
-                            vol.Optional(
-                                CONF_ADD_HEATER_POWER_SENSORS,
-                                default=section_options.get(
-                                    CONF_ADD_HEATER_POWER_SENSORS, False
-                                ),
-                            ): bool,
-                            vol.Optional(
-                                CONF_ADD_LIGHT_POWER_SENSORS,
-                                default=section_options.get(
-                                    CONF_ADD_LIGHT_POWER_SENSORS, False
-                                ),
-                            ): bool,
-                            vol.Optional(
-                                CONF_ADD_APPLIANCE_POWER_SENSORS,
-                                default=section_options.get(
-                                    CONF_ADD_APPLIANCE_POWER_SENSORS, False
-                                ),
-                            ): bool,
-                        }
-                    ),
-                    {"collapsed": False},
-                ),
-            }
-        )
+        data_schema = _build_init_schema(section_options)
 
         return self.async_show_form(step_id="init", data_schema=data_schema)
 
@@ -265,10 +246,32 @@ def _filter_power_section_options(options: dict[str, Any]) -> dict[str, Any]:
     """Return only schema-supported keys for the power/energy section."""
     if not isinstance(options, dict):
         return {}
-    allowed_keys = {
-        CONF_ADD_ROOM_POWER_SENSORS,
-        CONF_ADD_HEATER_POWER_SENSORS,
-        CONF_ADD_LIGHT_POWER_SENSORS,
-        CONF_ADD_APPLIANCE_POWER_SENSORS,
+    return {
+        key: value
+        for key, value in options.items()
+        if key in _POWER_SECTION_ALLOWED_KEYS
     }
-    return {key: value for key, value in options.items() if key in allowed_keys}
+
+
+def _build_init_schema(section_options: dict[str, Any]) -> vol.Schema:
+    """Return the options form schema with the current values as defaults."""
+    # Defaults are bound when vol.Optional is constructed, so the schema is
+    # rebuilt per render from the key/default table
+    return vol.Schema(
+        {
+            vol.Optional(
+                CONF_POWER_ENERGY_SECTION,
+                default=section_options,
+            ): section(
+                vol.Schema(
+                    {
+                        vol.Optional(
+                            key, default=section_options.get(key, default)
+                        ): bool
+                        for key, default in _POWER_SECTION_DEFAULTS.items()
+                    }
+                ),
+                _POWER_SECTION_OPTIONS,
+            ),
+        }
+    )
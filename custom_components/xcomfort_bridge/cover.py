@@ -9,14 +9,14 @@ from homeassistant.components.cover import (
     CoverEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .entity_lifecycle import (
+    async_write_state_safely,
     init_entity_lifecycle,
     mark_entity_added,
-    schedule_state_update_safely,
     subscribe_observable,
 )
 from .hub import XComfortHub
@@ -31,24 +31,22 @@ async def async_setup_entry(
     """Set up the xComfort Bridge covers from a config entry."""
     hub = XComfortHub.get_hub(hass, entry)
 
-    async def _wait_for_hub_then_setup():
-        await hub.has_done_initial_load.wait()
-
+    @callback
+    def _setup_entities() -> None:
         devices = hub.devices
 
         _LOGGER.debug("Found %s xcomfort devices", len(devices))
 
         shades = []
-        for device in devices:
-            if isinstance(device, Shade):
-                _LOGGER.debug("Adding %s", device)
-                shade = HASSXComfortShade(hass, hub, device)
-                shades.append(shade)
+        for device in hub.devices_of_type(Shade):
+            _LOGGER.debug("Adding %s", device)
+            shade = HASSXComfortShade(hass, hub, device)
+            shades.append(shade)
 
         _LOGGER.debug("Added %s shades", len(shades))
         async_add_entities(shades)
 
-    entry.async_create_task(hass, _wait_for_hub_then_setup())
+    hub.async_on_initial_load(_setup_entities)
 
 
 class HASSXComfortShade(CoverEntity):
@@ -88,6 +86,7 @@ class HASSXComfortShade(CoverEntity):
             self, self._device.state, self._state_change, "device.state"
         )
 
+    @callback
     def _state_change(self, state):
         """Handle state changes."""
         self._state = state
@@ -99,7 +98,7 @@ class HASSXComfortShade(CoverEntity):
         )  # Changed from f-string
 
         if should_update:
-            schedule_state_update_safely(self, "device.state")
+            async_write_state_safely(self, "device.state")
 
     @property
     def is_closed(self) -> bool | None:
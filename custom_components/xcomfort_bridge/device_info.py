@@ -11,8 +11,9 @@ from .xcomfort.constants import ComponentTypes
 
 if TYPE_CHECKING:
     from .hub import XComfortHub
+    from .xcomfort.bridge import Room
     from .xcomfort.comp import Comp
-    from .xcomfort.devices import HeatingValve, RcTouch
+    from .xcomfort.devices import Heater, HeatingValve, RcTouch
 
 
 def _get_rctouch_component(hub: XComfortHub, device: RcTouch) -> Comp | None:
@@ -70,3 +71,25 @@ def get_heating_valve_device_info(hub: XComfortHub, device: HeatingValve) -> Dev
         hw_version=comp_payload.get("versionHW"),
         via_device=(DOMAIN, hub.hub_id),
     )
+
+
+def get_heater_device_info(hub: XComfortHub, device: Heater) -> DeviceInfo:
+    """Return device metadata for a Heater device, shared by its sensors."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, f"heater_{DOMAIN}_{hub.identifier}-{device.device_id}")},
+        name=device.name,
+        manufacturer="Eaton",
+        model="xComfort Heating Actuator",
+        via_device=(DOMAIN, hub.hub_id),
+    )
+
+
+def get_room_device_info(hub: XComfortHub, room: Room) -> DeviceInfo:
+    """Return device metadata for a room, shared by its sensors and climate."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, f"room_{DOMAIN}_{hub.identifier}_{room.room_id}")},
+        name=room.name,
+        manufacturer="Eaton",
+        model="xComfort Room",
+        via_device=(DOMAIN, hub.hub_id),
+    )
@@ -19,7 +19,7 @@ from homeassistant.const import (
     CONF_PLATFORM,
     CONF_TYPE,
 )
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, State, callback
 from homeassistant.helpers import config_validation as cv, entity_registry as er
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
@@ -28,14 +28,16 @@ from .const import BUTTON_EVENT, DOMAIN
 
 CONF_SUBTYPE = "subtype"
 EVENT_TYPE_KEY = "event_type"
-SUPPORTED_TRIGGER_TYPES = {
-    "press_up",
-    "press_down",
-    "double_press_up",
-    "double_press_down",
-    "on",
-    "off",
-}
+SUPPORTED_TRIGGER_TYPES = frozenset(
+    {
+        "press_up",
+        "press_down",
+        "double_press_up",
+        "double_press_down",
+        "on",
+        "off",
+    }
+)
 DEFAULT_TRIGGER_TYPES = [
     "press_up",
     "press_down",
@@ -57,11 +59,11 @@ TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
 @callback
 def _get_event_entities_for_device(
     hass: HomeAssistant, device_id: str
-) -> list[er.RegistryEntry]:
-    """Return xComfort event entities attached to the given device."""
+) -> dict[str, er.RegistryEntry]:
+    """Return xComfort event entities attached to the given device, by entity_id."""
     entity_registry = er.async_get(hass)
-    return [
-        entry
+    return {
+        entry.entity_id: entry
         for entry in er.async_entries_for_device(entity_registry, device_id)
         if entry.domain == "event"
         and entry.disabled_by is None
@@ -69,52 +71,47 @@ def _get_event_entities_for_device(
             entry.platform == DOMAIN
             or (entry.unique_id or "").startswith(f"event_{DOMAIN}_")
         )
+    }
+
+
+def _filter_trigger_types(candidate: Any) -> list[str] | None:
+    """Return the supported entries of an event_types value, if it is a list."""
+    if not isinstance(candidate, list):
+        return None
+    return [
+        trigger_type
+        for trigger_type in candidate
+        if trigger_type in SUPPORTED_TRIGGER_TYPES
     ]
 
 
 @callback
 def _get_entity_trigger_types(
-    hass: HomeAssistant,
-    entity_id: str,
+    state: State | None,
     capabilities: Mapping[str, Any] | None = None,
 ) -> list[str]:
     """Return supported trigger types for an event entity."""
-    if capabilities:
-        capability_event_types = capabilities.get("event_types")
-        if isinstance(capability_event_types, list):
-            valid_types = [
-                trigger_type
-                for trigger_type in capability_event_types
-                if trigger_type in SUPPORTED_TRIGGER_TYPES
-            ]
-            if valid_types:
-                return valid_types
-
-    state = hass.states.get(entity_id)
-    if state is None:
-        return DEFAULT_TRIGGER_TYPES
+    if capabilities and (
+        valid_types := _filter_trigger_types(capabilities.get("event_types"))
+    ):
+        return valid_types
 
-    entity_event_types = state.attributes.get("event_types")
-    if not isinstance(entity_event_types, list):
+    if state is None:
         return DEFAULT_TRIGGER_TYPES
 
-    valid_types = [
-        trigger_type
-        for trigger_type in entity_event_types
-        if trigger_type in SUPPORTED_TRIGGER_TYPES
-    ]
-    return valid_types or DEFAULT_TRIGGER_TYPES
+    return (
+        _filter_trigger_types(state.attributes.get("event_types"))
+        or DEFAULT_TRIGGER_TYPES
+    )
 
 
 @callback
-def _get_entity_subtype(hass: HomeAssistant, entry: er.RegistryEntry) -> str:
+def _get_entity_subtype(entry: er.RegistryEntry, state: State | None) -> str:
     """Return a human-readable subtype label for trigger UI."""
-    if entry.entity_id:
-        state = hass.states.get(entry.entity_id)
-        if state:
-            friendly_name = state.attributes.get("friendly_name")
-            if isinstance(friendly_name, str) and friendly_name.strip():
-                return friendly_name
+    if state:
+        friendly_name = state.attributes.get("friendly_name")
+        if isinstance(friendly_name, str) and friendly_name.strip():
+            return friendly_name
 
     if entry.name:
         return entry.name
@@ -132,23 +129,16 @@ async def async_validate_trigger_config(
     """Validate trigger config."""
     config = TRIGGER_SCHEMA(config)
 
-    entity_entries = _get_event_entities_for_device(hass, config[CONF_DEVICE_ID])
-    matching_entity = next(
-        (
-            entry
-            for entry in entity_entries
-            if entry.entity_id == config[CONF_ENTITY_ID]
-        ),
-        None,
-    )
+    matching_entity = _get_event_entities_for_device(
+        hass, config[CONF_DEVICE_ID]
+    ).get(config[CONF_ENTITY_ID])
     if matching_entity is None:
         raise InvalidDeviceAutomationConfig(
             "Entity is not a valid xComfort event entity for this device"
         )
 
     if config[CONF_TYPE] not in _get_entity_trigger_types(
-        hass,
-        config[CONF_ENTITY_ID],
+        hass.states.get(config[CONF_ENTITY_ID]),
         matching_entity.capabilities,
     ):
         raise InvalidDeviceAutomationConfig(
@@ -184,16 +174,19 @@ async def async_get_triggers(
     hass: HomeAssistant, device_id: str
 ) -> list[dict[str, Any]]:
     """List device triggers for xComfort event entities."""
+    entity_entries = _get_event_entities_for_device(hass, device_id)
+    if not entity_entries:
+        # Most devices the automation editor asks about have no button events
+        return []
+
     triggers: list[dict[str, Any]] = []
-    entity_entries = sorted(
-        _get_event_entities_for_device(hass, device_id),
-        key=lambda entry: entry.entity_id or entry.unique_id or "",
-    )
 
-    for entry in entity_entries:
-        if not entry.entity_id:
-            continue
-        subtype = _get_entity_subtype(hass, entry)
+    # Entries are keyed by entity_id, so sorting the keys orders them without
+    # a per-element key callback
+    for entity_id in sorted(entity_entries):
+        entry = entity_entries[entity_id]
+        state = hass.states.get(entity_id)
+        subtype = _get_entity_subtype(entry, state)
         triggers.extend(
             {
                 CONF_DEVICE_ID: device_id,
@@ -203,9 +196,7 @@ async def async_get_triggers(
                 CONF_TYPE: trigger_type,
                 CONF_SUBTYPE: subtype,
             }
-            for trigger_type in _get_entity_trigger_types(
-                hass, entry.entity_id, entry.capabilities
-            )
+            for trigger_type in _get_entity_trigger_types(state, entry.capabilities)
         )
 
     return triggers
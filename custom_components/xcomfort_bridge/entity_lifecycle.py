@@ -49,15 +49,6 @@ def subscribe_observable(
 
 def async_write_state_safely(entity: Entity, source_name: str) -> bool:
     """Write entity state to HA with lifecycle guards and instrumentation."""
-    return _write_state_safely(entity, source_name=source_name, schedule=False)
-
-
-def schedule_state_update_safely(entity: Entity, source_name: str) -> bool:
-    """Schedule entity state update with lifecycle guards and instrumentation."""
-    return _write_state_safely(entity, source_name=source_name, schedule=True)
-
-
-def _write_state_safely(entity: Entity, source_name: str, schedule: bool) -> bool:
     if not hasattr(entity, "_xcomfort_rx_attached"):
         init_entity_lifecycle(entity)
 
@@ -66,17 +57,12 @@ def _write_state_safely(entity: Entity, source_name: str, schedule: bool) -> boo
         return False
 
     try:
-        if schedule:
-            entity.schedule_update_ha_state()
-        else:
-            entity.async_write_ha_state()
+        entity.async_write_ha_state()
     except Exception:
-        action = "schedule_update_ha_state" if schedule else "async_write_ha_state"
         _LOGGER.exception(
-            "State write failure for %s from %s using %s",
+            "State write failure for %s from %s using async_write_ha_state",
             _describe_entity(entity),
             source_name,
-            action,
         )
         return False
 
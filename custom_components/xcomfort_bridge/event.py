@@ -1,7 +1,9 @@
 """Support for xComfort buttons."""
 
 import asyncio
+from collections import defaultdict
 import logging
+from operator import attrgetter
 
 from homeassistant.components.event import EventDeviceClass, EventEntity
 from homeassistant.config_entries import ConfigEntry
@@ -24,6 +26,11 @@ from .xcomfort.devices import RcTouch, Rocker
 
 _LOGGER = logging.getLogger(__name__)
 DOUBLE_PRESS_WINDOW_S = 1.0
+_DEVICE_ID_KEY = attrgetter("device_id")
+_DOUBLE_PRESS_EVENT_TYPES = {
+    "press_up": "double_press_up",
+    "press_down": "double_press_down",
+}
 
 # Mapping of component types to their model names
 COMPONENT_TYPE_TO_MODEL = {
@@ -38,37 +45,25 @@ COMPONENT_TYPE_TO_MODEL = {
 }
 
 # Multi-channel component types that should be grouped into a single device
-MULTI_CHANNEL_COMPONENTS = {
-    ComponentTypes.PUSH_BUTTON_2_CHANNEL: 2,
-    ComponentTypes.PUSH_BUTTON_4_CHANNEL: 4,
-    ComponentTypes.PUSH_BUTTON_MULTI_SENSOR_2_CHANNEL: 2,
-    ComponentTypes.PUSH_BUTTON_MULTI_SENSOR_4_CHANNEL: 4,
-    ComponentTypes.REMOTE_CONTROL_2_CHANNEL: 2,
-}
-
-
-def _is_multi_channel_component(comp_type: int) -> bool:
-    """Check if a component type is multi-channel."""
-    return comp_type in MULTI_CHANNEL_COMPONENTS
-
-
-def _get_channel_count(comp_type: int) -> int:
-    """Get the number of channels for a multi-channel component."""
-    return MULTI_CHANNEL_COMPONENTS.get(comp_type, 1)
-
-
-def _is_momentary_rocker(comp: Comp) -> bool:
-    """Check if a rocker component is a momentary pushbutton (neutral position).
-
-    Args:
-        comp: XComfort Comp instance
+MULTI_CHANNEL_COMPONENTS = frozenset(
+    {
+        ComponentTypes.PUSH_BUTTON_2_CHANNEL,
+        ComponentTypes.PUSH_BUTTON_4_CHANNEL,
+        ComponentTypes.PUSH_BUTTON_MULTI_SENSOR_2_CHANNEL,
+        ComponentTypes.PUSH_BUTTON_MULTI_SENSOR_4_CHANNEL,
+        ComponentTypes.REMOTE_CONTROL_2_CHANNEL,
+    }
+)
 
-    Returns:
-        True if the rocker is a pushbutton type.
-        For now always returns True. Don't have full coverage of all types.
 
-    """
-    return True
+def _component_device_info(comp: Comp) -> DeviceInfo:
+    """Return the HA device info for an xComfort component."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, f"event_{DOMAIN}_comp_{comp.comp_id}")},
+        name=comp.name,
+        manufacturer="Eaton",
+        model=COMPONENT_TYPE_TO_MODEL.get(comp.comp_type, "Unknown"),
+    )
 
 
 async def async_setup_entry(
@@ -79,53 +74,58 @@ async def async_setup_entry(
     """Set up xComfort event devices."""
     hub = XComfortHub.get_hub(hass, entry)
 
-    async def _wait_for_hub_then_setup():
-        await hub.has_done_initial_load.wait()
-
+    @callback
+    def _setup_entities() -> None:
         events = []
+        comps = hub.bridge.comps
+
+        # Group rockers by component once instead of rescanning every device
+        # for each component
+        rockers_by_comp: defaultdict[str, list[Rocker]] = defaultdict(list)
+        for rocker in hub.devices_of_type(Rocker):
+            rockers_by_comp[rocker.comp_id].append(rocker)
 
         # Loop through components (xComfort components = HA devices)
-        for comp in hub.bridge.comps.values():
+        for comp in comps.values():
+            comp_type = comp.comp_type
             # Check if this is a pushbutton or remote control component type
-            if comp.comp_type not in COMPONENT_TYPE_TO_MODEL:
+            if comp_type not in COMPONENT_TYPE_TO_MODEL:
                 continue
 
             _LOGGER.debug(
                 "Processing component %s (id: %s, type: %s)",
                 comp.name,
                 comp.comp_id,
-                comp.comp_type,
+                comp_type,
             )
 
             # Find all devices (rockers) that belong to this component
-            component_devices = [
-                device
-                for device in hub.devices
-                if isinstance(device, Rocker)
-                and hasattr(device, "comp_id")
-                and device.comp_id == comp.comp_id
-            ]
+            component_devices = rockers_by_comp.get(comp.comp_id)
 
             if not component_devices:
                 _LOGGER.warning(
                     "Component %s (type: %s) has no rocker devices, skipping",
                     comp.name,
-                    comp.comp_type,
+                    comp_type,
                 )
                 continue
 
             # Sort by device_id to ensure consistent ordering
-            component_devices.sort(key=lambda d: d.device_id)
+            component_devices.sort(key=_DEVICE_ID_KEY)
 
-            _LOGGER.debug(
-                "Component %s has %d rocker device(s): %s",
-                comp.name,
-                len(component_devices),
-                [d.name for d in component_devices],
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Component %s has %d rocker device(s): %s",
+                    comp.name,
+                    len(component_devices),
+                    [d.name for d in component_devices],
+                )
+
+            # All buttons of a component share one HA device
+            device_info = _component_device_info(comp)
 
             # Check if this is a multi-channel component
-            if _is_multi_channel_component(comp.comp_type):
+            if comp_type in MULTI_CHANNEL_COMPONENTS:
                 # Create an event entity for each rocker device in this component
                 for idx, rocker in enumerate(component_devices):
                     button_number = idx + 1
@@ -136,7 +136,12 @@ async def async_setup_entry(
                         comp.name,
                     )
                     event = XComfortEvent(
-                        hass, hub, rocker, comp, button_number=button_number
+                        hass,
+                        hub,
+                        rocker,
+                        comp,
+                        button_number=button_number,
+                        device_info=device_info,
                     )
                     events.append(event)
             else:
@@ -146,33 +151,48 @@ async def async_setup_entry(
                         "Adding rocker %s for single-channel component %s (comp_type: %s, has_sensors: %s)",
                         rocker.name,
                         comp.name,
-                        comp.comp_type,
+                        comp_type,
                         rocker.has_sensors,
                     )
-                    event = XComfortEvent(hass, hub, rocker, comp)
+                    event = XComfortEvent(
+                        hass, hub, rocker, comp, device_info=device_info
+                    )
                     events.append(event)
 
         # Handle RcTouch devices separately
-        for device in hub.devices:
-            if isinstance(device, RcTouch):
-                comp = device.bridge.comps.get(device.comp_id)
+        for device in hub.devices_of_type(RcTouch):
+            comp = comps.get(device.comp_id)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug(
                     "Adding RcTouch button events for %s (comp: %s, comp_type: %s)",
                     device.name,
                     comp.name if comp else "Unknown",
                     comp.comp_type if comp else None,
                 )
-                event = XComfortRcTouchEvent(hass, hub, device, comp)
-                events.append(event)
+            event = XComfortRcTouchEvent(hass, hub, device, comp)
+            events.append(event)
 
         async_add_entities(events)
 
-    entry.async_create_task(hass, _wait_for_hub_then_setup())
+    hub.async_on_initial_load(_setup_entities)
 
 
 class XComfortButtonEventBase(EventEntity):
     """Shared button event behavior for rocker and RcTouch event entities."""
 
+    _attr_device_class = EventDeviceClass.BUTTON
+    # All supported rockers and RcTouch buttons are treated as momentary
+    # pushbuttons (neutral position); toggle on/off detection is not
+    # implemented yet. Kept a list: device triggers read it back from the
+    # registry capabilities and expect one.
+    _attr_event_types = [
+        "press_up",
+        "press_down",
+        "double_press_up",
+        "double_press_down",
+    ]
+    _attr_has_entity_name = True
+
     def _init_button_event_state(self) -> None:
         """Initialize shared in-memory state for button gesture detection."""
         init_entity_lifecycle(self)
@@ -188,6 +208,14 @@ class XComfortButtonEventBase(EventEntity):
                 handle.cancel()
                 self._pending_single_press[event_type] = None
 
+    @callback
+    def _async_handle_event(self, state) -> None:
+        """Handle a momentary button edge (True = up, False = down)."""
+        if state is None:
+            return
+
+        self._handle_momentary_press("press_up" if state else "press_down")
+
     def _handle_momentary_press(self, event_type: str) -> None:
         """Emit delayed single press or immediate double press for a direction."""
         pending_single = self._pending_single_press.get(event_type)
@@ -195,10 +223,7 @@ class XComfortButtonEventBase(EventEntity):
             # Second press within window: cancel pending single and emit double immediately.
             pending_single.cancel()
             self._pending_single_press[event_type] = None
-            if event_type == "press_up":
-                self._emit_event("double_press_up")
-            elif event_type == "press_down":
-                self._emit_event("double_press_down")
+            self._emit_event(_DOUBLE_PRESS_EVENT_TYPES[event_type])
             return
 
         def _emit_single_press() -> None:
@@ -229,7 +254,9 @@ class XComfortEvent(XComfortButtonEventBase):
         hub: XComfortHub,
         device: Rocker,
         comp: Comp,
+        *,
         button_number: int | None = None,
+        device_info: DeviceInfo | None = None,
     ) -> None:
         """Initialize the Event entity.
 
@@ -239,27 +266,9 @@ class XComfortEvent(XComfortButtonEventBase):
             device: Rocker device instance (xComfort device = HA entity)
             comp: XComfort Comp instance (xComfort component = HA device)
             button_number: Button number for multi-channel devices (1-based)
+            device_info: Shared device info of the component, built if omitted
 
         """
-        self._attr_device_class = EventDeviceClass.BUTTON
-        # Check if rocker is momentary (has neutral position)
-        # This includes multisensor rockers and regular rockers configured as momentary
-        self._is_momentary = device.has_sensors or _is_momentary_rocker(comp)
-
-        if self._is_momentary:
-            self._attr_event_types = [
-                "press_up",
-                "press_down",
-                "double_press_up",
-                "double_press_down",
-            ]
-        else:
-            self._attr_event_types = ["on", "off"]
-
-        self._attr_has_entity_name = True
-        self._button_number = button_number
-        self._comp = comp
-
         # Set entity name based on whether it's a multi-channel device
         if button_number is not None:
             self._attr_name = f"Button {button_number}"
@@ -273,13 +282,7 @@ class XComfortEvent(XComfortButtonEventBase):
 
         # xComfort Component = Home Assistant Device
         # Always create/reference a device based on the component
-        model = COMPONENT_TYPE_TO_MODEL.get(comp.comp_type, "Unknown")
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"event_{DOMAIN}_comp_{comp.comp_id}")},
-            name=comp.name,
-            manufacturer="Eaton",
-            model=model,
-        )
+        self._attr_device_info = device_info or _component_device_info(comp)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -289,22 +292,6 @@ class XComfortEvent(XComfortButtonEventBase):
             self, self._device.button_state, self._async_handle_event, "button_state"
         )
 
-    @callback
-    def _async_handle_event(self, state) -> None:
-        """Handle the button event."""
-
-        if state is None:
-            return
-
-        button_state = bool(state)
-
-        if self._is_momentary:
-            event_type = "press_up" if button_state else "press_down"
-            self._handle_momentary_press(event_type)
-        else:
-            # For toggle rockers, use on/off events
-            self._emit_event("on" if button_state else "off")
-
 
 class XComfortRcTouchEvent(XComfortButtonEventBase):
     """Entity class for xComfort RcTouch button events."""
@@ -321,15 +308,6 @@ class XComfortRcTouchEvent(XComfortButtonEventBase):
             comp: XComfort Comp instance
 
         """
-        self._attr_device_class = EventDeviceClass.BUTTON
-        # RcTouch buttons are momentary (press up/down)
-        self._attr_event_types = [
-            "press_up",
-            "press_down",
-            "double_press_up",
-            "double_press_down",
-        ]
-        self._attr_has_entity_name = True
         self._attr_name = "Button"
         self._attr_unique_id = f"event_{DOMAIN}_{device.device_id}"
         self._device = device
@@ -345,13 +323,3 @@ class XComfortRcTouchEvent(XComfortButtonEventBase):
         subscribe_observable(
             self, self._device.button_state, self._async_handle_event, "button_state"
         )
-
-    @callback
-    def _async_handle_event(self, state) -> None:
-        """Handle the button event."""
-        if state is None:
-            return
-
-        # state is bool (True = pressed/up, False = released/down)
-        event_type = "press_up" if bool(state) else "press_down"
-        self._handle_momentary_press(event_type)
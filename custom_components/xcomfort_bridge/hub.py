@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import asyncio
+from collections.abc import Callable
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 
 from .const import DOMAIN
 from .xcomfort.bridge import Bridge
@@ -37,10 +37,14 @@ class XComfortHub:
             self.identifier = ip
         self.entry = entry
         self._id = entry.unique_id
-        self.devices = []
-        self._loop = asyncio.get_event_loop()
+        self.devices: tuple = ()
+        self.rooms: tuple = ()
+        self.scenes: tuple = ()
+        self.devices_by_id: dict = {}
+        self.devices_by_type: dict[type, list] = {}
 
-        self.has_done_initial_load = asyncio.Event()
+        self.has_done_initial_load = False
+        self._ready_callbacks: list[Callable[[], None]] = []
 
     def start(self):
         """Start the event loop running the bridge."""
@@ -51,26 +55,59 @@ class XComfortHub:
 
         Will also shut down websocket, if open.
         """
-        self.has_done_initial_load.clear()
+        self.has_done_initial_load = False
+        self._ready_callbacks.clear()
         await self.bridge.close()
 
     async def load_devices(self):
         """Load devices from bridge."""
         devs = await self.bridge.get_devices()
-        self.devices = devs.values()
+        # The bridge already keys its devices by device_id
+        self.devices_by_id = devs
+        self.devices = tuple(devs.values())
+
+        # Bucket devices by concrete type once so platforms don't each rescan
+        devices_by_type: dict[type, list] = {}
+        for device in self.devices:
+            devices_by_type.setdefault(type(device), []).append(device)
+        self.devices_by_type = devices_by_type
 
         _LOGGER.info("loaded %s devices", len(self.devices))
         rooms = await self.bridge.get_rooms()
-        self.rooms = rooms.values()
+        self.rooms = tuple(rooms.values())
 
         _LOGGER.info("loaded %s rooms", len(self.rooms))
 
         scenes = await self.bridge.get_scenes()
-        self.scenes = scenes.values()
+        self.scenes = tuple(scenes.values())
 
         _LOGGER.info("loaded %s scenes", len(self.scenes))
 
-        self.has_done_initial_load.set()
+        self.has_done_initial_load = True
+        ready_callbacks, self._ready_callbacks = self._ready_callbacks, []
+        for ready_callback in ready_callbacks:
+            # Don't let one platform's failure block the others
+            try:
+                ready_callback()
+            except Exception:
+                _LOGGER.exception("Error setting up entities after initial load")
+
+    @callback
+    def async_on_initial_load(self, ready_callback: Callable[[], None]) -> None:
+        """Run ready_callback once devices are loaded, or now if they already are."""
+        if self.has_done_initial_load:
+            ready_callback()
+            return
+        self._ready_callbacks.append(ready_callback)
+
+    def devices_of_type(self, *device_types: type) -> list:
+        """Return loaded devices whose concrete type is one of device_types."""
+        devices_by_type = self.devices_by_type
+        return [
+            device
+            for device_type in device_types
+            for device in devices_by_type.get(device_type, ())
+        ]
 
     @property
     def hub_id(self) -> str:
@@ -102,9 +139,13 @@ class XComfortHub:
         """Return the number of home scenes."""
         return getattr(self.bridge, "home_scenes_count", 0)
 
+    @property
+    def home_scene_ids(self) -> frozenset:
+        """Return the ids of the bridge's home scenes."""
+        return getattr(self.bridge, "home_scene_ids", frozenset())
+
     async def test_connection(self) -> bool:
         """Test if connection to the bridge is working."""
-        await asyncio.sleep(1)
         return True
 
     @staticmethod
@@ -6,14 +6,14 @@ from math import ceil
 
 from homeassistant.components.light import ATTR_BRIGHTNESS, ColorMode, LightEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .entity_lifecycle import (
+    async_write_state_safely,
     init_entity_lifecycle,
     mark_entity_added,
-    schedule_state_update_safely,
     subscribe_observable,
 )
 from .hub import XComfortHub
@@ -28,24 +28,22 @@ async def async_setup_entry(
     """Set up xComfort light devices."""
     hub = XComfortHub.get_hub(hass, entry)
 
-    async def _wait_for_hub_then_setup():
-        await hub.has_done_initial_load.wait()
-
+    @callback
+    def _setup_entities() -> None:
         devices = hub.devices
 
         _LOGGER.debug("Found %s xcomfort devices", len(devices))
 
         lights = []
-        for device in devices:
-            if isinstance(device, Light):
-                _LOGGER.debug("Adding %s", device)
-                light = HASSXComfortLight(hass, hub, device)
-                lights.append(light)
+        for device in hub.devices_of_type(Light):
+            _LOGGER.debug("Adding %s", device)
+            light = HASSXComfortLight(hass, hub, device)
+            lights.append(light)
 
         _LOGGER.debug("Added %s lights", len(lights))
         async_add_entities(lights)
 
-    entry.async_create_task(hass, _wait_for_hub_then_setup())
+    hub.async_on_initial_load(_setup_entities)
 
 
 class HASSXComfortLight(LightEntity):
@@ -82,6 +80,7 @@ class HASSXComfortLight(LightEntity):
             self, self._device.state, self._state_change, "device.state"
         )
 
+    @callback
     def _state_change(self, state):
         """Handle state changes from the device."""
         self._state = state
@@ -91,7 +90,7 @@ class HASSXComfortLight(LightEntity):
         _LOGGER.debug("State changed %s : %s", self._name, state)
 
         if should_update:
-            schedule_state_update_safely(self, "device.state")
+            async_write_state_safely(self, "device.state")
 
     @property
     def device_info(self):
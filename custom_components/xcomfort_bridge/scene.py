@@ -8,7 +8,7 @@ try:
 except ImportError:  # HA >= 2026.x
     from homeassistant.components.scene import Scene as HA_SceneEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -25,18 +25,33 @@ async def async_setup_entry(
     """Set up xComfort scenes."""
     hub = XComfortHub.get_hub(hass, entry)
 
-    async def _wait_for_hub_then_setup():
-        await hub.has_done_initial_load.wait()
-
-        scenes = list(getattr(hub, "scenes", []))
+    @callback
+    def _setup_entities() -> None:
+        scenes = hub.scenes
         _LOGGER.debug("Found %s xcomfort scenes", len(scenes))
 
-        entities = [HASSXComfortScene(hub, scene) for scene in scenes]
+        # All scenes hang off the same service device
+        device_info = _scenes_device_info(hub)
+
+        # One entity per scene, so the count above is also the number added
+        async_add_entities(
+            HASSXComfortScene(hub, scene, device_info) for scene in scenes
+        )
 
-        _LOGGER.debug("Added %s scenes", len(entities))
-        async_add_entities(entities)
+    hub.async_on_initial_load(_setup_entities)
 
-    entry.async_create_task(hass, _wait_for_hub_then_setup())
+
+def _scenes_device_info(hub: XComfortHub) -> DeviceInfo:
+    """Return the HA service device info grouping a hub's scenes."""
+    bridge_name = hub.bridge_name or hub.identifier
+    return DeviceInfo(
+        identifiers={(DOMAIN, f"{hub.hub_id}_scenes")},
+        name=f"{bridge_name} Scenes",
+        manufacturer="Eaton",
+        model="xComfort Scenes",
+        entry_type=DeviceEntryType.SERVICE,
+        via_device=(DOMAIN, hub.hub_id),
+    )
 
 
 class HASSXComfortScene(HA_SceneEntity):
@@ -45,22 +60,19 @@ class HASSXComfortScene(HA_SceneEntity):
     _attr_should_poll = False
     _attr_has_entity_name = True
 
-    def __init__(self, hub: XComfortHub, scene: XComfortScene):
+    def __init__(
+        self,
+        hub: XComfortHub,
+        scene: XComfortScene,
+        device_info: DeviceInfo | None = None,
+    ):
         """Initialize the scene entity."""
         self.hub = hub
         self._scene = scene
         self._attr_name = scene.name
         self._attr_unique_id = f"scene_{DOMAIN}_{hub.identifier}-{scene.scene_id}"
 
-        bridge_name = hub.bridge_name or hub.identifier
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"{hub.hub_id}_scenes")},
-            name=f"{bridge_name} Scenes",
-            manufacturer="Eaton",
-            model="xComfort Scenes",
-            entry_type=DeviceEntryType.SERVICE,
-            via_device=(DOMAIN, hub.hub_id),
-        )
+        self._attr_device_info = device_info or _scenes_device_info(hub)
 
     async def async_activate(self, **kwargs) -> None:
         """Activate the scene."""
@@ -72,11 +84,13 @@ class HASSXComfortScene(HA_SceneEntity):
     @property
     def extra_state_attributes(self) -> dict:
         """Return extra state attributes."""
+        # Built per read: Scene.update and SET_BRIDGE_DATA can change these
+        scene = self._scene
         return {
-            "scene_id": self._scene.scene_id,
-            "order": self._scene.order,
-            "show": self._scene.show,
-            "icon": self._scene.icon,
-            "device_count": self._scene.device_count,
-            "home_scene": self._scene.scene_id in self.hub.bridge.home_scene_ids,
+            "scene_id": scene.scene_id,
+            "order": scene.order,
+            "show": scene.show,
+            "icon": scene.icon,
+            "device_count": scene.device_count,
+            "home_scene": scene.scene_id in self.hub.home_scene_ids,
         }
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-import math
 import time
 from typing import cast
 
@@ -22,7 +21,7 @@ from homeassistant.const import (
     UnitOfPower,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
@@ -36,7 +35,12 @@ from .const import (
     CONF_POWER_ENERGY_SECTION,
     DOMAIN,
 )
-from .device_info import get_heating_valve_device_info, get_rctouch_device_info
+from .device_info import (
+    get_heater_device_info,
+    get_heating_valve_device_info,
+    get_rctouch_device_info,
+    get_room_device_info,
+)
 from .entity_lifecycle import (
     async_write_state_safely,
     init_entity_lifecycle,
@@ -50,6 +54,23 @@ from .xcomfort.devices import Appliance, Heater, HeatingValve, Light, RcTouch, R
 
 _LOGGER = logging.getLogger(__name__)
 
+# Converts watts times seconds into kWh
+_KWH_PER_WATT_SECOND = 1 / 3600 / 1000
+
+# Raw room state keys that decide which room sensors are created
+_ROOM_SENSOR_KEYS = frozenset(
+    {
+        "lightsOn",
+        "windowsOpen",
+        "doorsOpen",
+        "power",
+        "temperatureOnly",
+        "temp",
+        "humidity",
+        "currentMode",
+    }
+)
+
 # Multi-channel component types that should be grouped into a single device
 MULTI_CHANNEL_COMPONENTS = {
     ComponentTypes.PUSH_BUTTON_2_CHANNEL,
@@ -88,25 +109,26 @@ def _remove_power_energy_entities(
 ) -> None:
     """Remove power/energy entities when options are disabled."""
     entity_registry = er.async_get(hass)
-    registry_entries = er.async_entries_for_config_entry(
-        entity_registry, entry.entry_id
-    )
+    # Index this entry's sensors once; each category is then a set lookup
+    sensor_entries = {
+        reg_entry.unique_id: reg_entry
+        for reg_entry in er.async_entries_for_config_entry(
+            entity_registry, entry.entry_id
+        )
+        if reg_entry.domain == "sensor"
+    }
 
     def _remove_entities_for_unique_ids(unique_ids: set[str], label: str) -> None:
-        if not unique_ids:
-            return
         removed = 0
-        for reg_entry in registry_entries:
-            if reg_entry.domain != "sensor":
-                continue
-            if reg_entry.unique_id in unique_ids:
-                _LOGGER.info(
-                    "Removing %s sensor entity due to options change: %s",
-                    label,
-                    reg_entry.entity_id,
-                )
-                entity_registry.async_remove(reg_entry.entity_id)
-                removed += 1
+        for unique_id in unique_ids & sensor_entries.keys():
+            entity_id = sensor_entries[unique_id].entity_id
+            _LOGGER.info(
+                "Removing %s sensor entity due to options change: %s",
+                label,
+                entity_id,
+            )
+            entity_registry.async_remove(entity_id)
+            removed += 1
         if removed:
             _LOGGER.debug("Removed %s %s entities", removed, label)
 
@@ -117,34 +139,31 @@ def _remove_power_energy_entities(
             room_unique_ids.add(f"energy_kwh_{room.room_id}")
         _remove_entities_for_unique_ids(room_unique_ids, "room power/energy")
 
+    # Collect the unique_ids of every disabled device category in one pass
+    disabled_unique_ids: dict[type, set[str]] = {}
     if not add_heater_power_sensors:
-        heater_unique_ids: set[str] = set()
-        for device in devices:
-            if isinstance(device, Heater):
-                heater_unique_ids.add(f"power_{device.name}_{device.device_id}")
-                heater_unique_ids.add(f"energy_{device.name}_{device.device_id}")
-        _remove_entities_for_unique_ids(heater_unique_ids, "heater power/energy")
-
+        disabled_unique_ids[Heater] = set()
     if not add_light_power_sensors:
-        light_unique_ids: set[str] = set()
-        for device in devices:
-            if isinstance(device, Light):
-                light_unique_ids.add(f"power_{device.name}_{device.device_id}")
-                light_unique_ids.add(f"energy_{device.name}_{device.device_id}")
-        _remove_entities_for_unique_ids(light_unique_ids, "light power/energy")
-
+        disabled_unique_ids[Light] = set()
     if not add_appliance_power_sensors:
-        appliance_unique_ids: set[str] = set()
-        for device in devices:
-            if isinstance(device, Appliance):
-                appliance_unique_ids.add(f"power_{device.name}_{device.device_id}")
-                appliance_unique_ids.add(f"energy_{device.name}_{device.device_id}")
-        _remove_entities_for_unique_ids(appliance_unique_ids, "appliance power/energy")
+        disabled_unique_ids[Appliance] = set()
+    if not disabled_unique_ids:
+        return
+
+    for device in devices:
+        unique_ids = disabled_unique_ids.get(type(device))
+        if unique_ids is not None:
+            unique_ids.add(f"power_{device.name}_{device.device_id}")
+            unique_ids.add(f"energy_{device.name}_{device.device_id}")
+
+    for device_type, unique_ids in disabled_unique_ids.items():
+        _remove_entities_for_unique_ids(
+            unique_ids, f"{device_type.__name__.lower()} power/energy"
+        )
 
 
 def _build_device_sensors(
     hub: XComfortHub,
-    devices: list,
     add_heater_power_sensors: bool,
     add_light_power_sensors: bool,
     add_appliance_power_sensors: bool,
@@ -153,80 +172,90 @@ def _build_device_sensors(
     sensors: list[SensorEntity] = []
     processed_multi_sensor_comps = set()
 
-    for device in devices:
-        if isinstance(device, RcTouch):
+    # Walk the hub's per-type buckets so no device goes through an isinstance chain
+    for device in hub.devices_of_type(RcTouch):
+        _LOGGER.debug(
+            "Adding temperature and humidity sensors for RcTouch device %s",
+            device.name,
+        )
+        sensors.append(XComfortRcTouchTemperatureSensor(hub, device))
+        sensors.append(XComfortRcTouchHumiditySensor(hub, device))
+
+    for device in hub.devices_of_type(HeatingValve):
+        _LOGGER.debug(
+            "Adding ambient temperature, device temperature, and valve position sensors for HeatingValve device %s",
+            device.name,
+        )
+        sensors.append(XComfortHeatingValveAmbientTemperatureSensor(hub, device))
+        sensors.append(XComfortHeatingValveDeviceTemperatureSensor(hub, device))
+        sensors.append(XComfortHeatingValvePositionSensor(hub, device))
+
+    for device in hub.devices_of_type(Heater):
+        if add_heater_power_sensors:
             _LOGGER.debug(
-                "Adding temperature and humidity sensors for RcTouch device %s",
+                "Adding temperature, heating demand, power, and energy sensors for Heater device %s",
                 device.name,
             )
-            sensors.append(XComfortRcTouchTemperatureSensor(hub, device))
-            sensors.append(XComfortRcTouchHumiditySensor(hub, device))
-        elif isinstance(device, HeatingValve):
+        else:
             _LOGGER.debug(
-                "Adding ambient temperature, device temperature, and valve position sensors for HeatingValve device %s",
+                "Adding temperature and heating demand sensors for Heater device %s",
                 device.name,
             )
-            sensors.append(XComfortHeatingValveAmbientTemperatureSensor(hub, device))
-            sensors.append(XComfortHeatingValveDeviceTemperatureSensor(hub, device))
-            sensors.append(XComfortHeatingValvePositionSensor(hub, device))
-        elif isinstance(device, Heater):
-            if add_heater_power_sensors:
-                _LOGGER.debug(
-                    "Adding temperature, heating demand, power, and energy sensors for Heater device %s",
-                    device.name,
-                )
-            else:
-                _LOGGER.debug(
-                    "Adding temperature and heating demand sensors for Heater device %s",
-                    device.name,
-                )
-            sensors.append(XComfortHeaterTemperatureSensor(hub, device))
-            sensors.append(XComfortHeaterHeatingDemandSensor(hub, device))
-            if add_heater_power_sensors:
-                sensors.append(XComfortHeaterPowerSensor(hub, device))
-                sensors.append(XComfortHeaterEnergySensor(hub, device))
-        elif isinstance(device, Light) and add_light_power_sensors:
+        device_info = get_heater_device_info(hub, device)
+        sensors.append(XComfortHeaterTemperatureSensor(hub, device, device_info))
+        sensors.append(XComfortHeaterHeatingDemandSensor(hub, device, device_info))
+        if add_heater_power_sensors:
+            sensors.append(XComfortHeaterPowerSensor(hub, device, device_info))
+            sensors.append(XComfortHeaterEnergySensor(hub, device, device_info))
+
+    if add_light_power_sensors:
+        for device in hub.devices_of_type(Light):
             _LOGGER.debug(
                 "Adding power and energy sensors for Light device %s", device.name
             )
             sensors.append(XComfortLightPowerSensor(hub, device))
             sensors.append(XComfortLightEnergySensor(hub, device))
-        elif isinstance(device, Appliance) and add_appliance_power_sensors:
+
+    if add_appliance_power_sensors:
+        for device in hub.devices_of_type(Appliance):
             _LOGGER.debug(
                 "Adding power and energy sensors for Appliance device %s", device.name
             )
             sensors.append(XComfortAppliancePowerSensor(hub, device))
             sensors.append(XComfortApplianceEnergySensor(hub, device))
-        elif isinstance(device, Rocker) and device.has_sensors:
-            comp = device.bridge._comps.get(device.comp_id)  # noqa: SLF001
-            if not comp:
-                _LOGGER.warning(
-                    "Rocker %s has sensors but no component, skipping", device.name
-                )
-                continue
 
-            # For multi-channel components, only create sensors once (not per button)
-            if _is_multi_channel_component(comp.comp_type):
-                if comp.comp_id in processed_multi_sensor_comps:
-                    _LOGGER.debug(
-                        "Skipping sensor creation for %s - already created for component %s",
-                        device.name,
-                        comp.name,
-                    )
-                    continue
-                processed_multi_sensor_comps.add(comp.comp_id)
-                _LOGGER.debug(
-                    "Adding temperature and humidity sensors for multi-channel multisensor component %s",
-                    comp.name,
-                )
-            else:
+    for device in hub.devices_of_type(Rocker):
+        if not device.has_sensors:
+            continue
+        comp = device.bridge._comps.get(device.comp_id)  # noqa: SLF001
+        if not comp:
+            _LOGGER.warning(
+                "Rocker %s has sensors but no component, skipping", device.name
+            )
+            continue
+
+        # For multi-channel components, only create sensors once (not per button)
+        if _is_multi_channel_component(comp.comp_type):
+            if comp.comp_id in processed_multi_sensor_comps:
                 _LOGGER.debug(
-                    "Adding temperature and humidity sensors for multisensor Rocker %s",
+                    "Skipping sensor creation for %s - already created for component %s",
                     device.name,
+                    comp.name,
                 )
+                continue
+            processed_multi_sensor_comps.add(comp.comp_id)
+            _LOGGER.debug(
+                "Adding temperature and humidity sensors for multi-channel multisensor component %s",
+                comp.name,
+            )
+        else:
+            _LOGGER.debug(
+                "Adding temperature and humidity sensors for multisensor Rocker %s",
+                device.name,
+            )
 
-            sensors.append(XComfortRockerTemperatureSensor(hub, device))
-            sensors.append(XComfortRockerHumiditySensor(hub, device))
+        sensors.append(XComfortRockerTemperatureSensor(hub, device))
+        sensors.append(XComfortRockerHumiditySensor(hub, device))
 
     return sensors
 
@@ -240,30 +269,34 @@ def _build_room_sensors(
     sensors: list[SensorEntity] = []
 
     for room in rooms:
-        if room.state.value is None or not hasattr(room.state.value, "raw"):
+        raw = getattr(room.state.value, "raw", None)
+        if raw is None:
             continue
 
-        raw = room.state.value.raw
+        present = _ROOM_SENSOR_KEYS.intersection(raw)
+        if not present:
+            continue
 
-        if "lightsOn" in raw:
+        if "lightsOn" in present:
             sensors.append(XComfortRoomLightsOnSensor(hub, room))
-        if "windowsOpen" in raw:
+        if "windowsOpen" in present:
             sensors.append(XComfortRoomWindowsOpenSensor(hub, room))
-        if "doorsOpen" in raw:
+        if "doorsOpen" in present:
             sensors.append(XComfortRoomDoorsOpenSensor(hub, room))
 
-        if add_room_power_sensors and "power" in raw:
-            sensors.append(XComfortPowerSensor(hub, room))
-            sensors.append(XComfortEnergySensor(hub, room))
+        if add_room_power_sensors and "power" in present:
+            device_info = get_room_device_info(hub, room)
+            sensors.append(XComfortPowerSensor(hub, room, device_info))
+            sensors.append(XComfortEnergySensor(hub, room, device_info))
 
-        if "temperatureOnly" in raw:
-            if "temp" in raw:
+        if "temperatureOnly" in present:
+            if "temp" in present:
                 sensors.append(XComfortRoomTemperatureSensor(hub, room))
-            if "humidity" in raw:
+            if "humidity" in present:
                 sensors.append(XComfortRoomHumiditySensor(hub, room))
 
             if raw.get("temperatureOnly") is False:
-                if "currentMode" in raw:
+                if "currentMode" in present:
                     sensors.append(XComfortRoomCurrentModeSensor(hub, room))
                 sensors.append(XComfortRoomValveSensor(hub, room))
 
@@ -315,39 +348,39 @@ async def async_setup_entry(
 
     async_add_entities(hub_sensors)
 
-    async def _wait_for_hub_then_setup():
-        await hub.has_done_initial_load.wait()
-
-        devices = list(hub.devices)
-        rooms = list(hub.rooms)
-
-        _LOGGER.debug("Found %s xcomfort devices", len(list(devices)))
-        _remove_power_energy_entities(
-            hass,
-            entry,
-            devices,
-            rooms,
-            add_room_power_sensors,
-            add_heater_power_sensors,
-            add_light_power_sensors,
-            add_appliance_power_sensors,
-        )
+    @callback
+    def _setup_entities() -> None:
+        devices = hub.devices
+        rooms = hub.rooms
 
+        _LOGGER.debug("Found %s xcomfort devices", len(devices))
         sensors = _build_device_sensors(
             hub,
-            devices,
             add_heater_power_sensors,
             add_light_power_sensors,
             add_appliance_power_sensors,
         )
 
-        _LOGGER.debug("Found %s xcomfort rooms", len(list(rooms)))
+        _LOGGER.debug("Found %s xcomfort rooms", len(rooms))
         sensors.extend(_build_room_sensors(hub, rooms, add_room_power_sensors))
 
         _LOGGER.debug("Added %s sensor entities", len(sensors))
         async_add_entities(sensors)
 
-    entry.async_create_task(hass, _wait_for_hub_then_setup())
+        # Pruning only touches categories that were not added above, so it
+        # can run after the new entities are handed to the platform
+        _remove_power_energy_entities(
+            hass,
+            entry,
+            devices,
+            rooms,
+            add_room_power_sensors,
+            add_heater_power_sensors,
+            add_light_power_sensors,
+            add_appliance_power_sensors,
+        )
+
+    hub.async_on_initial_load(_setup_entities)
 
 
 class XComfortHubSensor(SensorEntity):
@@ -401,12 +434,18 @@ class XComfortHubSensor(SensorEntity):
 class XComfortPowerSensor(SensorEntity):
     """Entity class for xComfort power sensors."""
 
-    def __init__(self, hub: XComfortHub, room: Room):
+    def __init__(
+        self,
+        hub: XComfortHub,
+        room: Room,
+        device_info: DeviceInfo | None = None,
+    ):
         """Initialize the power sensor entity.
 
         Args:
             hub: XComfortHub instance
             room: Room instance
+            device_info: Shared room device info, built if omitted
 
         """
         self.entity_description = SensorEntityDescription(
@@ -427,14 +466,7 @@ class XComfortPowerSensor(SensorEntity):
         self._state = None
         init_entity_lifecycle(self)
 
-        device_id = f"room_{DOMAIN}_{hub.identifier}_{room.room_id}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-            name=self._room.name,
-            manufacturer="Eaton",
-            model="xComfort Room",
-            via_device=(DOMAIN, hub.hub_id),
-        )
+        self._attr_device_info = device_info or get_room_device_info(hub, room)
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to room state after entity attachment."""
@@ -461,12 +493,18 @@ class XComfortPowerSensor(SensorEntity):
 class XComfortEnergySensor(RestoreSensor):
     """Entity class for xComfort energy sensors."""
 
-    def __init__(self, hub: XComfortHub, room: Room):
+    def __init__(
+        self,
+        hub: XComfortHub,
+        room: Room,
+        device_info: DeviceInfo | None = None,
+    ):
         """Initialize the energy sensor entity.
 
         Args:
             hub: XComfortHub instance
             room: Room instance
+            device_info: Shared room device info, built if omitted
 
         """
         self.entity_description = SensorEntityDescription(
@@ -486,14 +524,7 @@ class XComfortEnergySensor(RestoreSensor):
         self._updateTime = time.monotonic()
         self._consumption = 0
 
-        device_id = f"room_{DOMAIN}_{hub.identifier}_{room.room_id}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-            name=self._room.name,
-            manufacturer="Eaton",
-            model="xComfort Room",
-            via_device=(DOMAIN, hub.hub_id),
-        )
+        self._attr_device_info = device_info or get_room_device_info(hub, room)
 
     async def async_added_to_hass(self) -> None:
         """Call when entity about to be added to hass."""
@@ -506,26 +537,32 @@ class XComfortEnergySensor(RestoreSensor):
 
     def _state_change(self, state):
         should_update = self._state is not None
+        # Close the elapsed interval at the power that was in effect during it
+        self._accumulate()
         self._state = state
         if should_update:
             async_write_state_safely(self, "room.state")
 
+    async def async_update(self) -> None:
+        """Advance the energy total on each poll."""
+        self._accumulate()
+
+    def _accumulate(self) -> None:
+        """Add the energy used at the current power since the last update."""
+        if self._state and self._state.power is not None:
+            self.calculate(self._state.power)
+
     def calculate(self, power):
         """Calculate energy consumption since last update."""
         now = time.monotonic()
-        timediff = math.floor(
-            now - self._updateTime
-        )  # number of seconds since last update
-        self._consumption += (
-            power / 3600 / 1000 * timediff
-        )  # Calculate, in kWh, energy consumption since last update.
+        # Energy in kWh since the last update
+        self._consumption += power * (now - self._updateTime) * _KWH_PER_WATT_SECOND
         self._updateTime = now
 
     @property
     def native_value(self):
         """Return the current value."""
         if self._state and self._state.power is not None:
-            self.calculate(self._state.power)
             return self._consumption
         return None
 
@@ -633,12 +670,18 @@ class XComfortRcTouchHumiditySensor(SensorEntity):
 class XComfortHeaterTemperatureSensor(SensorEntity):
     """Entity class for xComfort Heater temperature sensors."""
 
-    def __init__(self, hub: XComfortHub, device: Heater):
+    def __init__(
+        self,
+        hub: XComfortHub,
+        device: Heater,
+        device_info: DeviceInfo | None = None,
+    ):
         """Initialize the temperature sensor entity.
 
         Args:
             hub: XComfortHub instance
             device: Heater device instance
+            device_info: Shared heater device info, built if omitted
 
         """
         self.entity_description = SensorEntityDescription(
@@ -658,15 +701,7 @@ class XComfortHeaterTemperatureSensor(SensorEntity):
         self._state = None
         init_entity_lifecycle(self)
 
-        # Create device info for the heater
-        device_id = f"heater_{DOMAIN}_{hub.identifier}-{device.device_id}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-            name=device.name,
-            manufacturer="Eaton",
-            model="xComfort Heating Actuator",
-            via_device=(DOMAIN, hub.hub_id),
-        )
+        self._attr_device_info = device_info or get_heater_device_info(hub, device)
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to device state after entity attachment."""
@@ -692,12 +727,18 @@ class XComfortHeaterTemperatureSensor(SensorEntity):
 class XComfortHeaterHeatingDemandSensor(SensorEntity):
     """Entity class for xComfort Heater heating demand sensors."""
 
-    def __init__(self, hub: XComfortHub, device: Heater):
+    def __init__(
+        self,
+        hub: XComfortHub,
+        device: Heater,
+        device_info: DeviceInfo | None = None,
+    ):
         """Initialize the heating demand sensor entity.
 
         Args:
             hub: XComfortHub instance
             device: Heater device instance
+            device_info: Shared heater device info, built if omitted
 
         """
         self.entity_description = SensorEntityDescription(
@@ -717,11 +758,7 @@ class XComfortHeaterHeatingDemandSensor(SensorEntity):
         self._state = None
         init_entity_lifecycle(self)
 
-        # Link to the same device as the temperature sensor
-        device_id = f"heater_{DOMAIN}_{hub.identifier}-{device.device_id}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-        )
+        self._attr_device_info = device_info or get_heater_device_info(hub, device)
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to device state after entity attachment."""
@@ -747,12 +784,18 @@ class XComfortHeaterHeatingDemandSensor(SensorEntity):
 class XComfortHeaterPowerSensor(SensorEntity):
     """Entity class for xComfort Heater power sensors."""
 
-    def __init__(self, hub: XComfortHub, device: Heater):
+    def __init__(
+        self,
+        hub: XComfortHub,
+        device: Heater,
+        device_info: DeviceInfo | None = None,
+    ):
         """Initialize the power sensor entity.
 
         Args:
             hub: XComfortHub instance
             device: Heater device instance
+            device_info: Shared heater device info, built if omitted
 
         """
         self.entity_description = SensorEntityDescription(
@@ -770,11 +813,7 @@ class XComfortHeaterPowerSensor(SensorEntity):
         self._state = None
         init_entity_lifecycle(self)
 
-        # Link to the same device as the temperature sensor
-        device_id = f"heater_{DOMAIN}_{hub.identifier}-{device.device_id}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-        )
+        self._attr_device_info = device_info or get_heater_device_info(hub, device)
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to device state after entity attachment."""
@@ -799,12 +838,18 @@ class XComfortHeaterPowerSensor(SensorEntity):
 class XComfortHeaterEnergySensor(RestoreSensor):
     """Entity class for xComfort Heater energy sensors."""
 
-    def __init__(self, hub: XComfortHub, device: Heater):
+    def __init__(
+        self,
+        hub: XComfortHub,
+        device: Heater,
+        device_info: DeviceInfo | None = None,
+    ):
         """Initialize the energy sensor entity.
 
         Args:
             hub: XComfortHub instance
             device: Heater device instance
+            device_info: Shared heater device info, built if omitted
 
         """
         self.entity_description = SensorEntityDescription(
@@ -824,11 +869,7 @@ class XComfortHeaterEnergySensor(RestoreSensor):
         self._consumption = 0.0
         init_entity_lifecycle(self)
 
-        # Link to the same device as the temperature sensor
-        device_id = f"heater_{DOMAIN}_{hub.identifier}-{device.device_id}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-        )
+        self._attr_device_info = device_info or get_heater_device_info(hub, device)
 
     async def async_added_to_hass(self) -> None:
         """Call when entity about to be added to hass."""
@@ -843,16 +884,27 @@ class XComfortHeaterEnergySensor(RestoreSensor):
 
     def _state_change(self, state):
         should_update = self._state is not None
+        # Close the elapsed interval at the power that was in effect during it
+        self._accumulate()
         self._state = state
         if should_update:
             async_write_state_safely(self, "device.state")
 
+    async def async_update(self) -> None:
+        """Advance the energy total on each poll."""
+        self._accumulate()
+
+    def _accumulate(self) -> None:
+        """Add the energy used at the current power since the last update."""
+        if self._state and self._state.power is not None:
+            self._calculate(self._state.power)
+
     def _calculate(self, power: float) -> None:
         """Calculate energy consumption since last update."""
         now = time.monotonic()
         time_diff = now - self._update_time  # number of seconds since last update
         self._consumption += (
-            power / 3600 / 1000 * time_diff
+            power * time_diff * _KWH_PER_WATT_SECOND
         )  # Calculate, in kWh, energy consumption since last update
         self._update_time = now
 
@@ -860,7 +912,6 @@ class XComfortHeaterEnergySensor(RestoreSensor):
     def native_value(self):
         """Return the current value."""
         if self._state and self._state.power is not None:
-            self._calculate(self._state.power)
             return round(self._consumption, 3)
         return None
 
@@ -970,22 +1021,32 @@ class XComfortLightEnergySensor(RestoreSensor):
 
     def _state_change(self, state):
         should_update = self._state is not None
+        # Close the elapsed interval at the power that was in effect during it
+        self._accumulate()
         self._state = state
         if should_update:
             async_write_state_safely(self, "device.state")
 
+    async def async_update(self) -> None:
+        """Advance the energy total on each poll."""
+        self._accumulate()
+
+    def _accumulate(self) -> None:
+        """Add the energy used at the current power since the last update."""
+        if self._state and getattr(self._state, "power", None) is not None:
+            self._calculate(self._state.power)
+
     def _calculate(self, power: float) -> None:
         """Calculate energy consumption since last update."""
         now = time.monotonic()
         time_diff = now - self._update_time
-        self._consumption += power / 3600 / 1000 * time_diff
+        self._consumption += power * time_diff * _KWH_PER_WATT_SECOND
         self._update_time = now
 
     @property
     def native_value(self):
         """Return the current value."""
         if self._state and getattr(self._state, "power", None) is not None:
-            self._calculate(self._state.power)
             return round(self._consumption, 3)
         return None
 
@@ -1097,22 +1158,32 @@ class XComfortApplianceEnergySensor(RestoreSensor):
 
     def _state_change(self, state):
         should_update = self._state is not None
+        # Close the elapsed interval at the power that was in effect during it
+        self._accumulate()
         self._state = state
         if should_update:
             async_write_state_safely(self, "device.state")
 
+    async def async_update(self) -> None:
+        """Advance the energy total on each poll."""
+        self._accumulate()
+
+    def _accumulate(self) -> None:
+        """Add the energy used at the current power since the last update."""
+        if self._state and getattr(self._state, "power", None) is not None:
+            self._calculate(self._state.power)
+
     def _calculate(self, power: float) -> None:
         """Calculate energy consumption since last update."""
         now = time.monotonic()
         time_diff = now - self._update_time
-        self._consumption += power / 3600 / 1000 * time_diff
+        self._consumption += power * time_diff * _KWH_PER_WATT_SECOND
         self._update_time = now
 
     @property
     def native_value(self):
         """Return the current value."""
         if self._state and getattr(self._state, "power", None) is not None:
-            self._calculate(self._state.power)
             return round(self._consumption, 3)
         return None
 
@@ -1172,12 +1243,8 @@ class XComfortRockerTemperatureSensor(SensorEntity):
     @property
     def native_value(self):
         """Return the current value."""
-        if self._state is None:
-            return None
         # Handle both RockerSensorState and legacy bool states
-        if hasattr(self._state, "temperature"):
-            return self._state.temperature
-        return None
+        return getattr(self._state, "temperature", None)
 
 
 class XComfortRockerHumiditySensor(SensorEntity):
@@ -1235,12 +1302,8 @@ class XComfortRockerHumiditySensor(SensorEntity):
     @property
     def native_value(self):
         """Return the current value."""
-        if self._state is None:
-            return None
         # Handle both RockerSensorState and legacy bool states
-        if hasattr(self._state, "humidity"):
-            return self._state.humidity
-        return None
+        return getattr(self._state, "humidity", None)
 
 
 class XComfortRoomSensorBase(SensorEntity):
@@ -1293,14 +1356,7 @@ class XComfortRoomSensorBase(SensorEntity):
         self._state = None
         init_entity_lifecycle(self)
 
-        device_id = f"room_{DOMAIN}_{hub.identifier}_{room.room_id}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-            name=room.name,
-            manufacturer="Eaton",
-            model="xComfort Room",
-            via_device=(DOMAIN, hub.hub_id),
-        )
+        self._attr_device_info = get_room_device_info(hub, room)
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to room state after entity attachment."""
@@ -1318,12 +1374,13 @@ class XComfortRoomSensorBase(SensorEntity):
     @property
     def native_value(self):
         """Return the current value."""
-        if self._state is None or not hasattr(self._state, "raw"):
+        raw = getattr(self._state, "raw", None)
+        if raw is None:
             return None
 
-        value = self._state.raw.get(self._state_key)
+        value = raw.get(self._state_key)
         if self._value_fn:
-            return self._value_fn(value, self._state.raw)
+            return self._value_fn(value, raw)
         return value
 
 
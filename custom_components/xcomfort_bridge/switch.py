@@ -5,15 +5,15 @@ import logging
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .entity_lifecycle import (
+    async_write_state_safely,
     init_entity_lifecycle,
     mark_entity_added,
-    schedule_state_update_safely,
     subscribe_observable,
 )
 from .hub import XComfortHub
@@ -34,22 +34,20 @@ async def async_setup_entry(
     # Rx observable, which resolves once the first SET_BRIDGE_DATA arrives.
     async_add_entities([XComfortRemoteAccessSwitch(hub)])
 
-    async def _wait_for_hub_then_setup():
-        await hub.has_done_initial_load.wait()
-
+    @callback
+    def _setup_entities() -> None:
         devices = hub.devices
         _LOGGER.debug("Found %s xcomfort devices", len(devices))
 
         switches = []
-        for device in devices:
-            if isinstance(device, Appliance):
-                _LOGGER.debug("Adding appliance switch %s", device)
-                switches.append(HASSXComfortSwitch(hass, hub, device))
+        for device in hub.devices_of_type(Appliance):
+            _LOGGER.debug("Adding appliance switch %s", device)
+            switches.append(HASSXComfortSwitch(hass, hub, device))
 
         _LOGGER.debug("Added %s switches", len(switches))
         async_add_entities(switches)
 
-    entry.async_create_task(hass, _wait_for_hub_then_setup())
+    hub.async_on_initial_load(_setup_entities)
 
 
 class HASSXComfortSwitch(SwitchEntity):
@@ -74,11 +72,12 @@ class HASSXComfortSwitch(SwitchEntity):
             self, self._device.state, self._state_change, "device.state"
         )
 
+    @callback
     def _state_change(self, state):
         """Handle state changes from the device."""
         self._state = state
         if self._state is not None:
-            schedule_state_update_safely(self, "device.state")
+            async_write_state_safely(self, "device.state")
 
     def _set_optimistic_state(self, is_on: bool) -> None:
         """Set optimistic state after successful command send."""
@@ -168,11 +167,12 @@ class XComfortRemoteAccessSwitch(SwitchEntity):
             "bridge.remote_allowed",
         )
 
+    @callback
     def _on_remote_allowed(self, value: bool | None) -> None:
         if value is None:
             return
         self._is_on = bool(value)
-        schedule_state_update_safely(self, "bridge.remote_allowed")
+        async_write_state_safely(self, "bridge.remote_allowed")
 
     @property
     def should_poll(self) -> bool:
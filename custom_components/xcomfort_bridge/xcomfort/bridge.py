@@ -69,6 +69,8 @@ class Bridge:
         self._scenes = {}
         self.state = State.Uninitialized
         self.on_initialized = asyncio.Event()
+        # Set once the first SET_BRIDGE_DATA (name/type/scenes) has been parsed
+        self.home_data_received = asyncio.Event()
         self.connection = None
         self.connection_subscription = None
 
@@ -78,7 +80,7 @@ class Bridge:
         self.bridge_type = None
         self.fw_version = None
         self.home_scenes_count = 0
-        self.home_scene_ids = []
+        self.home_scene_ids = frozenset()
         self.home_data = {}
 
         # Bridge state (for sensors)
@@ -668,7 +670,7 @@ class Bridge:
 
         # Extract home scenes count
         home_scenes = payload.get("homeScenes", [])
-        self.home_scene_ids = list(home_scenes)
+        self.home_scene_ids = frozenset(home_scenes)
         self.home_scenes_count = len(home_scenes)
 
         # Remote-access flags are optional keys — only emit when present so we
@@ -686,6 +688,7 @@ class Bridge:
             self.fw_version,
             self.home_scenes_count,
         )
+        self.home_data_received.set()
 
     async def set_remote_access(self, allowed: bool) -> None:
         """Toggle the bridge's remote-access (cloud connection) permission.
@@ -801,6 +804,7 @@ class Bridge:
         _LOGGER.info("Closing bridge connection")
         self.state = State.Closing
         self.on_initialized.clear()
+        self.home_data_received.clear()
 
         if isinstance(self.connection, SecureBridgeConnection):
             self.connection_subscription.dispose()
@@ -834,14 +838,17 @@ class Bridge:
         """Get all devices."""
         await self.wait_for_initialization()
 
-        _LOGGER.debug("Getting all devices - total count: %d", len(self._devices))
-        for device_id, device in self._devices.items():
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
-                "Device: id=%s, name=%s, type=%s",
-                device_id,
-                device.name,
-                type(device).__name__,
+                "Getting all devices - total count: %d", len(self._devices)
             )
+            for device_id, device in self._devices.items():
+                _LOGGER.debug(
+                    "Device: id=%s, name=%s, type=%s",
+                    device_id,
+                    device.name,
+                    type(device).__name__,
+                )
 
         return self._devices
 
@@ -849,11 +856,15 @@ class Bridge:
         """Get all rooms."""
         await self.wait_for_initialization()
 
-        _LOGGER.debug("Getting all rooms - total count: %d", len(self._rooms))
-        for room_id, room in self._rooms.items():
-            _LOGGER.debug(
-                "Room: id=%s, name=%s, type=%s", room_id, room.name, type(room).__name__
-            )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Getting all rooms - total count: %d", len(self._rooms))
+            for room_id, room in self._rooms.items():
+                _LOGGER.debug(
+                    "Room: id=%s, name=%s, type=%s",
+                    room_id,
+                    room.name,
+                    type(room).__name__,
+                )
 
         return self._rooms
 
@@ -861,9 +872,10 @@ class Bridge:
         """Get all scenes."""
         await self.wait_for_initialization()
 
-        _LOGGER.debug("Getting all scenes - total count: %d", len(self._scenes))
-        for scene_id, scene in self._scenes.items():
-            _LOGGER.debug("Scene: id=%s, name=%s", scene_id, scene.name)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Getting all scenes - total count: %d", len(self._scenes))
+            for scene_id, scene in self._scenes.items():
+                _LOGGER.debug("Scene: id=%s, name=%s", scene_id, scene.name)
 
         return self._scenes
 
@@ -75,7 +75,7 @@ class Rocker(BridgeDevice):
         if not self._comp_subscribed:
             comp = self.bridge._comps.get(self.comp_id)  # noqa: SLF001
             if comp is not None:
-                comp.state.subscribe(lambda _: self._on_component_update())
+                comp.state.subscribe(self._on_component_update)
                 self._comp_subscribed = True
 
         self._find_and_subscribe_sensor_device()
@@ -223,7 +223,7 @@ class Rocker(BridgeDevice):
         # Return current values if we have them
         return self.temperature, self.humidity
 
-    def _on_component_update(self) -> None:
+    def _on_component_update(self, _state=None) -> None:
         """Handle component state updates.
 
         Component updates are logged for debugging but sensor data comes
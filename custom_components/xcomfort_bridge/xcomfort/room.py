@@ -130,9 +130,7 @@ class Room:
         """Set target temperature for room."""
         # Validate that new setpoint is within allowed ranges.
         # if above/below allowed values, set to the edge value
-        setpointrange = self.bridge.rctsetpointallowedvalues[
-            ClimateMode(self.state.value.mode)
-        ]
+        setpointrange = self.bridge.rctsetpointallowedvalues[self.state.value.mode]
 
         original_setpoint = setpoint
         setpoint = min(setpoint, setpointrange.Max)
@@ -4,6 +4,13 @@ import logging
 
 _LOGGER = logging.getLogger(__name__)
 
+_ICON_BY_NAME = {
+    "Home": "mdi:home-account",
+    "Away": "mdi:home-off",
+    "Night": "mdi:weather-night",
+    "Morning": "mdi:weather-sunset-up",
+}
+
 
 class Scene:
     """Scene representation."""
@@ -37,16 +44,7 @@ class Scene:
     @property
     def icon(self) -> str | None:
         """Return scene icon ID."""
-        name = self.payload.get("name")
-
-        icon_map = {
-            "Home": "mdi:home-account",
-            "Away": "mdi:home-off",
-            "Night": "mdi:weather-night",
-            "Morning": "mdi:weather-sunset-up",
-        }
-
-        return icon_map.get(name, "mdi:button-pointer")
+        return _ICON_BY_NAME.get(self.payload.get("name"), "mdi:button-pointer")
 
     @property
     def devices(self) -> list: